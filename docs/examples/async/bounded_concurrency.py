@@ -0,0 +1,25 @@
+import asyncio
+
+from pydynox import Model, ModelConfig
+from pydynox.attributes import StringAttribute
+
+
+class User(Model):
+    model_config = ModelConfig(table="users")
+    pk = StringAttribute(hash_key=True)
+    name = StringAttribute()
+
+
+async def save_all(users: list[User], max_in_flight: int = 50):
+    # At most 50 requests at the same time
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def save_one(user: User):
+        async with semaphore:
+            await user.async_save()
+
+    await asyncio.gather(*(save_one(user) for user in users))
+
+
+users = [User(pk=f"USER#{i}", name=f"User {i}") for i in range(1000)]
+asyncio.run(save_all(users))
@@ -0,0 +1,21 @@
+from pydynox import Model, ModelConfig
+from pydynox.attributes import StringAttribute
+
+
+class User(Model):
+    model_config = ModelConfig(table="users")
+    pk = StringAttribute(hash_key=True)
+    sk = StringAttribute(range_key=True)
+    name = StringAttribute()
+
+
+# Save 100 users - sent as 4 requests of 25
+users = [User(pk=f"USER#{i}", sk="PROFILE", name=f"User {i}") for i in range(100)]
+User.batch_save(users)
+
+# Get many users by key - sent in groups of 100
+keys = [{"pk": f"USER#{i}", "sk": "PROFILE"} for i in range(10)]
+found = User.batch_get(keys)
+
+# Delete many users
+User.batch_delete(found)
@@ -0,0 +1,184 @@
+"""Internal code generation for model methods. Do not use directly.
+
+Some model methods loop over attribute names on every call. The names are
+known when the class is created, so Model.__init_subclass__ builds a
+version of those methods for each model class with the names written in.
+
+Each generated method belongs to one class. When it runs for a subclass
+(a custom method calling super()), it hands off to the generic Model
+method, which reads the subclass attributes.
+"""
+
+from __future__ import annotations
+
+import keyword
+from typing import TYPE_CHECKING, Any, Callable
+
+from pydynox.generators import is_auto_generate
+
+if TYPE_CHECKING:
+    from pydynox.attributes import Attribute
+
+__all__ = ["GENERATED", "make_from_dict", "make_get_key", "make_init", "make_to_dict"]
+
+# Set on every generated function, so subclasses know they can replace it
+GENERATED = "__pydynox_generated__"
+
+
+def _is_safe_name(name: str) -> bool:
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _compile(
+    name: str, lines: list[str], namespace: dict[str, Any], doc: str | None
+) -> Callable[..., Any]:
+    exec("\n".join(lines), namespace)
+    func: Callable[..., Any] = namespace[name]
+    func.__doc__ = doc
+    setattr(func, GENERATED, True)
+    return func
+
+
+def make_get_key(
+    owner: type, key_attrs: tuple[str, ...], fallback: Callable[..., Any]
+) -> Callable[..., Any] | None:
+    """Build `_get_key(self)` for the given key attribute names.
+
+    Returns None if a name can't be used in generated code.
+    """
+    if not all(_is_safe_name(name) for name in key_attrs):
+        return None
+    namespace: dict[str, Any] = {"_owner": owner, "_fallback": fallback}
+    items = ", ".join(f"{name!r}: self.{name}" for name in key_attrs)
+    lines = [
+        "def _get_key(self):",
+        "    if type(self) is not _owner:",
+        "        return _fallback(self)",
+        f"    return {{{items}}}",
+    ]
+    return _compile("_get_key", lines, namespace, fallback.__doc__)
+
+
+def make_init(
+    owner: type, attributes: dict[str, Attribute[Any]], fallback: Callable[..., Any]
+) -> Callable[..., Any] | None:
+    """Build `__init__(self, *, name=..., **kwargs)` with one block per attribute.
+
+    Gives the same result as `Model.__init__`: values passed in are set
+    as is, missing values get the default (or None for auto-generate),
+    missing required values raise ValueError, unknown keywords are
+    ignored. Returns None if a name can't be used in generated code.
+    """
+    if not all(_is_safe_name(name) for name in attributes):
+        return None
+    # Attribute names become parameter names here, so they must not
+    # shadow the names the function itself uses. Builtins are reached
+    # through private names for the same reason (an attribute can be
+    # called `type`).
+    if any(name.startswith("_") or name in ("self", "kwargs") for name in attributes):
+        return None
+    namespace: dict[str, Any] = {
+        "_MISSING": object(),
+        "_owner": owner,
+        "_fallback": fallback,
+        "_type": type,
+        "_ValueError": ValueError,
+    }
+    params = "".join(f"{name}=_MISSING, " for name in attributes)
+    given = ", ".join(f"({name!r}, {name})" for name in attributes)
+    lines = [
+        f"def __init__(self, *, {params}**kwargs):",
+        "    if _type(self) is not _owner:",
+        f"        for _name, _value in ({given}{',' if len(attributes) == 1 else ''}):",
+        "            if _value is not _MISSING:",
+        "                kwargs[_name] = _value",
+        "        return _fallback(self, **kwargs)",
+    ]
+    for i, (name, attr) in enumerate(attributes.items()):
+        lines.append(f"    if {name} is _MISSING:")
+        if attr.default is not None:
+            if is_auto_generate(attr.default):
+                # Auto-generate defaults are applied on save()
+                lines.append(f"        {name} = None")
+            else:
+                namespace[f"_default_{i}"] = attr.default
+                lines.append(f"        {name} = _default_{i}")
+        elif not attr.null:
+            lines.append(f"        raise _ValueError(\"Attribute '{name}' is required\")")
+        else:
+            lines.append(f"        {name} = None")
+        lines.append(f"    self.{name} = {name}")
+    return _compile("__init__", lines, namespace, fallback.__doc__)
+
+
+def make_to_dict(
+    owner: type, attributes: dict[str, Attribute[Any]], fallback: Callable[..., Any]
+) -> Callable[..., Any] | None:
+    """Build `to_dict(self)` with one block per attribute.
+
+    None values are skipped, same as `Model.to_dict`. Returns None if a
+    name can't be used in generated code.
+    """
+    if not all(_is_safe_name(name) for name in attributes):
+        return None
+    namespace: dict[str, Any] = {"_owner": owner, "_fallback": fallback}
+    lines = [
+        "def to_dict(self):",
+        "    if type(self) is not _owner:",
+        "        return _fallback(self)",
+        "    values = self.__dict__",
+        "    result = {}",
+    ]
+    for i, (name, attr) in enumerate(attributes.items()):
+        namespace[f"_serialize_{i}"] = attr.serialize
+        lines.append(f"    value = values.get({name!r})")
+        lines.append("    if value is not None:")
+        lines.append(f"        result[{name!r}] = _serialize_{i}(value)")
+    lines.append("    return result")
+    return _compile("to_dict", lines, namespace, fallback.__doc__)
+
+
+def make_from_dict(
+    owner: type, attributes: dict[str, Attribute[Any]], fallback: Callable[..., Any]
+) -> Callable[..., Any] | None:
+    """Build `from_dict(cls, data)` that fills a new instance directly.
+
+    Gives the same result as `cls(**deserialized)` with the default
+    `Model.__init__`: missing values get the default (or None for
+    auto-generate), missing required values raise ValueError, unknown
+    keys are ignored. Returns None if a name can't be used in generated
+    code.
+    """
+    if not all(_is_safe_name(name) for name in attributes):
+        return None
+    namespace: dict[str, Any] = {
+        "_MISSING": object(),
+        "_new": object.__new__,
+        "_owner": owner,
+        "_fallback": fallback,
+    }
+    lines = [
+        "def from_dict(cls, data):",
+        "    if cls is not _owner:",
+        "        return _fallback(cls, data)",
+        "    self = _new(cls)",
+    ]
+    for i, (name, attr) in enumerate(attributes.items()):
+        namespace[f"_deserialize_{i}"] = attr.deserialize
+        lines.append(f"    value = data.get({name!r}, _MISSING)")
+        lines.append("    if value is _MISSING:")
+        if attr.default is not None:
+            if is_auto_generate(attr.default):
+                # Auto-generate defaults are applied on save()
+                lines.append(f"        self.{name} = None")
+            else:
+                namespace[f"_default_{i}"] = attr.default
+                lines.append(f"        self.{name} = _default_{i}")
+        elif not attr.null:
+            lines.append(f"        raise ValueError(\"Attribute '{name}' is required\")")
+        else:
+            lines.append(f"        self.{name} = None")
+        lines.append("    else:")
+        lines.append(f"        self.{name} = _deserialize_{i}(value)")
+    lines.append("    return self")
+    return _compile("from_dict", lines, namespace, fallback.__doc__)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from pydynox._internal._logging import _log_operation, _log_warning
@@ -9,11 +12,60 @@ from pydynox._internal._metrics import DictWithMetrics, ListWithMetrics, Operati
 from pydynox.query import AsyncQueryResult, QueryResult
 
 if TYPE_CHECKING:
+    from pydynox import pydynox_core
     from pydynox.rate_limit import AdaptiveRate, FixedRate
 
 # Threshold for slow query warning (ms)
 _SLOW_QUERY_THRESHOLD_MS = 100.0
 
+# Rust clients shared by DynamoDBClient instances built with the same
+# arguments, so they share one connection pool. Kept small: an evicted
+# client stays alive as long as a DynamoDBClient still uses it.
+_MAX_SHARED_CLIENTS = 16
+_shared_clients: OrderedDict[tuple[str | None, ...], pydynox_core.DynamoDBClient] = OrderedDict()
+_shared_clients_lock = threading.Lock()
+
+
+def _get_core_client(
+    region: str | None,
+    access_key: str | None,
+    secret_key: str | None,
+    session_token: str | None,
+    profile: str | None,
+    endpoint_url: str | None,
+) -> pydynox_core.DynamoDBClient:
+    """Get a Rust client for these arguments, reusing one if possible."""
+    from pydynox import pydynox_core
+
+    def build() -> pydynox_core.DynamoDBClient:
+        return pydynox_core.DynamoDBClient(
+            region=region,
+            access_key=access_key,
+            secret_key=secret_key,
+            session_token=session_token,
+            profile=profile,
+            endpoint_url=endpoint_url,
+        )
+
+    # Without an explicit region the client reads it from the environment
+    # when it's built, so don't share it
+    if region is None:
+        return build()
+
+    key = (region, access_key, secret_key, session_token, profile, endpoint_url)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is not None:
+            _shared_clients.move_to_end(key)
+            return client
+
+    client = build()
+    with _shared_clients_lock:
+        _shared_clients[key] = client
+        if len(_shared_clients) > _MAX_SHARED_CLIENTS:
+            _shared_clients.popitem(last=False)
+    return client
+
 
 class DynamoDBClient:
     """DynamoDB client with flexible credential configuration.
@@ -24,6 +76,10 @@ class DynamoDBClient:
     3. Environment variables (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY)
     4. Default credential chain (instance profile, etc.)
 
+    The client keeps a pool of HTTPS connections open between calls
+    (keep-alive), so create it once and reuse it. Clients created with the
+    same arguments (and an explicit region) share one pool.
+
     Example:
         >>> # Use environment variables
         >>> client = DynamoDBClient()
@@ -57,15 +113,8 @@ class DynamoDBClient:
         endpoint_url: str | None = None,
         rate_limit: FixedRate | AdaptiveRate | None = None,
     ):
-        from pydynox import pydynox_core
-
-        self._client = pydynox_core.DynamoDBClient(
-            region=region,
-            access_key=access_key,
-            secret_key=secret_key,
-            session_token=session_token,
-            profile=profile,
-            endpoint_url=endpoint_url,
+        self._client = _get_core_client(
+            region, access_key, secret_key, session_token, profile, endpoint_url
         )
         self._rate_limit = rate_limit
 
@@ -79,6 +128,18 @@ class DynamoDBClient:
         if self._rate_limit is not None:
             self._rate_limit._acquire_rcu(rcu)
 
+    @property
+    def _query_acquire_rcu(self) -> Callable[[float], None] | None:
+        """The rate limiter's own acquire method, or None without a limiter.
+
+        Query results call this before every page. Handing them the limiter
+        method directly skips the `_acquire_rcu` wrapper, and the call is
+        skipped entirely when there is no rate limiter.
+        """
+        if self._rate_limit is None:
+            return None
+        return self._rate_limit._acquire_rcu
+
     def _acquire_wcu(self, wcu: float = 1.0) -> None:
         """Acquire write capacity before an operation."""
         if self._rate_limit is not None:
@@ -279,6 +340,7 @@ class DynamoDBClient:
         index_name: str | None = None,
         last_evaluated_key: dict[str, Any] | None = None,
         consistent_read: bool = False,
+        prefetch: bool = False,
     ) -> QueryResult:
         """Query items from a DynamoDB table.
 
@@ -297,6 +359,8 @@ class DynamoDBClient:
             last_evaluated_key: Start key for pagination (from previous query).
             consistent_read: If True, use strongly consistent read (2x RCU cost).
                 Default is False (eventually consistent).
+            prefetch: If True, fetch the next page in a background thread
+                while you process the current one. Default is False.
 
         Returns:
             A QueryResult that can be iterated and has `last_evaluated_key`.
@@ -328,8 +392,9 @@ class DynamoDBClient:
             scan_index_forward=scan_index_forward,
             index_name=index_name,
             last_evaluated_key=last_evaluated_key,
-            acquire_rcu=self._acquire_rcu,
+            acquire_rcu=self._query_acquire_rcu,
             consistent_read=consistent_read,
+            prefetch=prefetch,
         )
 
     def batch_write(
@@ -798,7 +863,7 @@ class DynamoDBClient:
             scan_index_forward=scan_index_forward,
             index_name=index_name,
             last_evaluated_key=last_evaluated_key,
-            acquire_rcu=self._acquire_rcu,
+            acquire_rcu=self._query_acquire_rcu,
             consistent_read=consistent_read,
         )
 
@@ -55,7 +55,7 @@ def clear_default_client() -> None:
     _default_client = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """Type-safe model configuration.
 
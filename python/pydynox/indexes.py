@@ -81,6 +81,15 @@ class GlobalSecondaryIndex(Generic[M]):
         >>> users = User.email_index.query(email="john@example.com")
     """
 
+    __slots__ = (
+        "index_name",
+        "hash_key",
+        "range_key",
+        "projection",
+        "_model_class",
+        "_attr_name",
+    )
+
     def __init__(
         self,
         index_name: str,
@@ -101,7 +110,7 @@ class GlobalSecondaryIndex(Generic[M]):
         self.range_key = range_key
         self.projection = projection
 
-        # Set by Model metaclass
+        # Set by Model.__init_subclass__
         self._model_class: type[M] | None = None
         self._attr_name: str | None = None
 
@@ -195,7 +204,8 @@ class GlobalSecondaryIndex(Generic[M]):
     def to_dynamodb_definition(self) -> dict[str, Any]:
         """Convert to DynamoDB GSI definition format.
 
-        Used when creating tables with GSIs.
+        Used when creating tables with GSIs. Each call returns a new dict,
+        so callers can change it.
 
         Returns:
             Dict in DynamoDB CreateTable GSI format.
@@ -213,7 +223,7 @@ class GlobalSecondaryIndex(Generic[M]):
         elif isinstance(self.projection, list):
             projection = {
                 "ProjectionType": "INCLUDE",
-                "NonKeyAttributes": self.projection,
+                "NonKeyAttributes": list(self.projection),
             }
         else:
             projection = {"ProjectionType": "ALL"}
@@ -337,7 +347,7 @@ class GSIQueryResult(Generic[M]):
             scan_index_forward=self._scan_index_forward,
             index_name=self._index_name,
             last_evaluated_key=self._start_key,
-            acquire_rcu=client._acquire_rcu,
+            acquire_rcu=client._query_acquire_rcu,
         )
 
     def __iter__(self) -> GSIQueryResult[M]:
@@ -357,14 +367,7 @@ class GSIQueryResult(Generic[M]):
         instance = self._model_class.from_dict(item)
 
         # Run after_load hooks
-        skip = (
-            self._model_class.model_config.skip_hooks
-            if hasattr(self._model_class, "model_config")
-            else False
-        )
-        if not skip:
-            from pydynox.hooks import HookType
-
-            instance._run_hooks(HookType.AFTER_LOAD)
+        if self._model_class._has_after_load and not self._model_class._skip_hooks_default:
+            instance._fire_after_load()
 
         return instance
@@ -5,7 +5,11 @@ Shared code between Pydantic and dataclass integrations.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, TypeVar
+from collections.abc import Iterable
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, TypeVar
+
+from pydynox.config import get_default_client
 
 if TYPE_CHECKING:
     from pydynox.client import DynamoDBClient
@@ -13,6 +17,121 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
+class DynamoDBMixin:
+    """CRUD methods shared by all integrations.
+
+    `add_dynamodb_methods` creates a subclass of the user class with this
+    mixin as a base, so the methods come from normal method lookup.
+    """
+
+    __slots__ = ()
+
+    _pydynox_table: ClassVar[str]
+    _pydynox_hash_key: ClassVar[str]
+    _pydynox_range_key: ClassVar[str | None]
+    _pydynox_key_names: ClassVar[tuple[str, ...]]
+    _pydynox_key_getter: ClassVar[Callable[[Any], Any]]
+    _pydynox_client: ClassVar[DynamoDBClient | None]
+    _pydynox_to_dict: ClassVar[Callable[[Any], dict[str, Any]]]
+    _pydynox_from_dict: ClassVar[Callable[[Any, dict[str, Any]], Any]]
+    _pydynox_validate_update: ClassVar[Callable[[Any, dict[str, Any]], dict[str, Any]] | None]
+
+    @classmethod
+    def _get_client(cls) -> DynamoDBClient:
+        """Get the DynamoDB client.
+
+        Uses the client passed to the decorator (or `_set_client`), then
+        the default client. The default client is cached on the class, so
+        later calls don't look it up again.
+        """
+        client = cls._pydynox_client
+        if client is None:
+            client = get_default_client()
+            if client is None:
+                raise RuntimeError(
+                    f"No client set for {cls.__name__}. Pass client= to dynamodb_model(), "
+                    "call _set_client() or call pydynox.set_default_client()."
+                )
+            cls._pydynox_client = client
+        return client
+
+    @classmethod
+    def _set_client(cls, client: DynamoDBClient) -> None:
+        """Set the DynamoDB client."""
+        cls._pydynox_client = client
+
+    @classmethod
+    def get(cls, **keys: Any) -> Any:
+        """Get an item from DynamoDB by its key."""
+        item = cls._get_client().get_item(cls._pydynox_table, keys)
+        if item is None:
+            return None
+        return cls._pydynox_from_dict(cls, item)
+
+    @classmethod
+    def batch_save(cls, items: Iterable[Any]) -> None:
+        """Save many items using BatchWriteItem.
+
+        Items are sent in groups of 25 and unprocessed items are retried
+        with exponential backoff.
+        """
+        put_items = [cls._pydynox_to_dict(item) for item in items]
+        if put_items:
+            cls._get_client().batch_write(cls._pydynox_table, put_items=put_items)
+
+    @classmethod
+    def batch_delete(cls, items: Iterable[Any]) -> None:
+        """Delete many items using BatchWriteItem.
+
+        Keys are sent in groups of 25 and unprocessed keys are retried
+        with exponential backoff.
+        """
+        delete_keys = [item._get_key() for item in items]
+        if delete_keys:
+            cls._get_client().batch_write(cls._pydynox_table, delete_keys=delete_keys)
+
+    def save(self) -> None:
+        """Save to DynamoDB."""
+        cls = type(self)
+        cls._get_client().put_item(cls._pydynox_table, cls._pydynox_to_dict(self))
+
+    def delete(self) -> None:
+        """Delete from DynamoDB."""
+        cls = type(self)
+        cls._get_client().delete_item(cls._pydynox_table, self._get_key())
+
+    def update(self, **kwargs: Any) -> None:
+        """Update specific attributes."""
+        cls = type(self)
+
+        # Validate if validator provided (Pydantic)
+        if cls._pydynox_validate_update:
+            validated = cls._pydynox_validate_update(self, kwargs)
+            # Send the validated values, so DynamoDB gets what the instance holds
+            kwargs = {name: validated.get(name, value) for name, value in kwargs.items()}
+            for attr_name, value in kwargs.items():
+                setattr(self, attr_name, value)
+        else:
+            # Simple update (dataclass)
+            for attr_name, value in kwargs.items():
+                if not hasattr(self, attr_name):
+                    raise AttributeError(f"'{cls.__name__}' has no attribute '{attr_name}'")
+                setattr(self, attr_name, value)
+
+        # Update in DynamoDB
+        cls._get_client().update_item(cls._pydynox_table, self._get_key(), updates=kwargs)
+
+    def _get_key(self) -> dict[str, Any]:
+        """Get the key dict for this instance."""
+        cls = type(self)
+        names = cls._pydynox_key_names
+        values = cls._pydynox_key_getter(self)
+        # attrgetter gives a tuple for two names and a single value for one
+        if len(names) == 1:
+            return {names[0]: values}
+        return dict(zip(names, values))
+
+
 def add_dynamodb_methods(
     cls: type[T],
     table: str,
@@ -23,7 +142,11 @@ def add_dynamodb_methods(
     from_dict: Callable[[type[T], dict[str, Any]], T],
     validate_update: Callable[[T, dict[str, Any]], dict[str, Any]] | None = None,
 ) -> type[T]:
-    """Add DynamoDB methods to a class.
+    """Create a subclass of `cls` with DynamoDB methods.
+
+    The original class is not changed. The subclass keeps the same name,
+    qualname and module, so it can replace the original in place (this is
+    what the decorator does).
 
     Args:
         cls: The class to enhance.
@@ -36,93 +159,49 @@ def add_dynamodb_methods(
         validate_update: Optional function to validate updates (for Pydantic).
 
     Returns:
-        The class with DynamoDB methods added.
+        A subclass of `cls` with DynamoDB methods.
+    """
+    metaclass: Any = type(cls)
+    new_cls = metaclass(
+        cls.__name__,
+        (cls, DynamoDBMixin),
+        {
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__doc__": cls.__doc__,
+            "__slots__": (),
+        },
+    )
+
+    # Set after class creation so Pydantic doesn't turn the underscore
+    # names into private attributes.
+    set_dynamodb_metadata(
+        new_cls, table, hash_key, range_key, client, to_dict, from_dict, validate_update
+    )
+
+    return new_cls  # type: ignore[no-any-return]
+
+
+def set_dynamodb_metadata(
+    cls: type[Any],
+    table: str,
+    hash_key: str,
+    range_key: str | None,
+    client: DynamoDBClient | None,
+    to_dict: Callable[[Any], dict[str, Any]],
+    from_dict: Callable[[Any, dict[str, Any]], Any],
+    validate_update: Callable[[Any, dict[str, Any]], dict[str, Any]] | None = None,
+) -> None:
+    """Store the table, key and conversion settings `DynamoDBMixin` reads.
+
+    `cls` must already have `DynamoDBMixin` as a base.
     """
-    # Store metadata
-    cls._pydynox_table = table  # type: ignore
-    cls._pydynox_hash_key = hash_key  # type: ignore
-    cls._pydynox_range_key = range_key  # type: ignore
-    cls._pydynox_client = client  # type: ignore
-    cls._pydynox_to_dict = staticmethod(to_dict)  # type: ignore
-    cls._pydynox_from_dict = staticmethod(from_dict)  # type: ignore
-    cls._pydynox_validate_update = staticmethod(validate_update) if validate_update else None  # type: ignore
-
-    # Add methods
-    cls._get_client = classmethod(_get_client_method)  # type: ignore
-    cls._set_client = classmethod(_set_client_method)  # type: ignore
-    cls.get = classmethod(_get_method)  # type: ignore
-    cls.save = _save_method  # type: ignore
-    cls.delete = _delete_method  # type: ignore
-    cls.update = _update_method  # type: ignore
-    cls._get_key = _get_key_method  # type: ignore
-
-    return cls
-
-
-def _get_client_method(cls: type[T]) -> "DynamoDBClient":
-    """Get the DynamoDB client."""
-    if cls._pydynox_client is None:  # type: ignore
-        raise RuntimeError(
-            f"No client set for {cls.__name__}. "
-            "Pass client= to dynamodb_model() or call _set_client()."
-        )
-    return cls._pydynox_client  # type: ignore
-
-
-def _set_client_method(cls: type[T], client: "DynamoDBClient") -> None:
-    """Set the DynamoDB client."""
-    cls._pydynox_client = client  # type: ignore
-
-
-def _get_method(cls: type[T], **keys: Any) -> T | None:
-    """Get an item from DynamoDB by its key."""
-    client = cls._get_client()  # type: ignore
-    item = client.get_item(cls._pydynox_table, keys)  # type: ignore
-    if item is None:
-        return None
-    return cls._pydynox_from_dict(cls, item)  # type: ignore
-
-
-def _save_method(self: T) -> None:
-    """Save to DynamoDB."""
-    client = self.__class__._get_client()  # type: ignore
-    item = self.__class__._pydynox_to_dict(self)  # type: ignore
-    client.put_item(self.__class__._pydynox_table, item)  # type: ignore
-
-
-def _delete_method(self: T) -> None:
-    """Delete from DynamoDB."""
-    client = self.__class__._get_client()  # type: ignore
-    key = self._get_key()  # type: ignore
-    client.delete_item(self.__class__._pydynox_table, key)  # type: ignore
-
-
-def _update_method(self: T, **kwargs: Any) -> None:
-    """Update specific attributes."""
-    cls = self.__class__
-
-    # Validate if validator provided (Pydantic)
-    if cls._pydynox_validate_update:  # type: ignore
-        validated = cls._pydynox_validate_update(self, kwargs)  # type: ignore
-        for attr_name, value in kwargs.items():
-            setattr(self, attr_name, validated.get(attr_name, value))
-    else:
-        # Simple update (dataclass)
-        for attr_name, value in kwargs.items():
-            if not hasattr(self, attr_name):
-                raise AttributeError(f"'{cls.__name__}' has no attribute '{attr_name}'")
-            setattr(self, attr_name, value)
-
-    # Update in DynamoDB
-    client = cls._get_client()  # type: ignore
-    key = self._get_key()  # type: ignore
-    client.update_item(cls._pydynox_table, key, updates=kwargs)  # type: ignore
-
-
-def _get_key_method(self: T) -> dict[str, Any]:
-    """Get the key dict for this instance."""
-    cls = self.__class__
-    key = {cls._pydynox_hash_key: getattr(self, cls._pydynox_hash_key)}  # type: ignore
-    if cls._pydynox_range_key:  # type: ignore
-        key[cls._pydynox_range_key] = getattr(self, cls._pydynox_range_key)  # type: ignore
-    return key
+    cls._pydynox_table = table
+    cls._pydynox_hash_key = hash_key
+    cls._pydynox_range_key = range_key
+    cls._pydynox_key_names = (hash_key, range_key) if range_key else (hash_key,)
+    cls._pydynox_key_getter = attrgetter(*cls._pydynox_key_names)
+    cls._pydynox_client = client
+    cls._pydynox_to_dict = staticmethod(to_dict)
+    cls._pydynox_from_dict = staticmethod(from_dict)
+    cls._pydynox_validate_update = staticmethod(validate_update) if validate_update else None
@@ -84,7 +84,7 @@ def dynamodb_model(
         try:
             from pydantic import BaseModel
 
-            if issubclass(cls, BaseModel):
+            if isinstance(cls, type) and BaseModel in cls.__mro__:
                 from pydynox.integrations.pydantic import from_pydantic
 
                 return from_pydantic(cls, table, hash_key, range_key, client)
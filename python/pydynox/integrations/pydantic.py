@@ -19,17 +19,19 @@ Example:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Annotated, Any, TypeVar
 
-from pydynox.integrations._base import add_dynamodb_methods
+from pydynox.integrations._base import DynamoDBMixin, add_dynamodb_methods, set_dynamodb_metadata
 
 if TYPE_CHECKING:
     from pydynox.client import DynamoDBClient
 
 try:
-    from pydantic import BaseModel
+    from pydantic import BaseModel, PydanticUserError, TypeAdapter
 except ImportError:
     BaseModel = None  # type: ignore
+    PydanticUserError = None  # type: ignore
+    TypeAdapter = None  # type: ignore
 
 T = TypeVar("T")
 
@@ -90,21 +92,135 @@ def from_pydantic(
     """
     _check_pydantic()
 
-    if not issubclass(cls, BaseModel):
+    # A plain MRO lookup, without going through the metaclass subclass hook
+    if not (isinstance(cls, type) and BaseModel in cls.__mro__):
         raise TypeError(f"{cls.__name__} must be a Pydantic BaseModel subclass")
 
-    def to_dict(instance: T) -> dict[str, Any]:
-        return instance.model_dump()  # type: ignore
+    to_dict, from_dict, validate_update = _converters(cls)
+    return add_dynamodb_methods(
+        cls, table, hash_key, range_key, client, to_dict, from_dict, validate_update
+    )
+
+
+def _converters(cls: type[Any]) -> tuple[Any, Any, Any]:
+    """Build the to_dict, from_dict and validate_update functions for `cls`.
+
+    `cls` must be a Pydantic model class. Callers check that first.
+    """
+
+    # The model's own model_dump, called as a plain function on save
+    to_dict = cls.model_dump
 
     def from_dict(klass: type[T], data: dict[str, Any]) -> T:
         return klass.model_validate(data)  # type: ignore
 
-    def validate_update(instance: T, updates: dict[str, Any]) -> dict[str, Any]:
+    # Field and model validators can look at other fields, so models that
+    # have them (or use strict mode) still go through a full model_validate.
+    decorators = cls.__pydantic_decorators__
+    full_validation = bool(
+        decorators.field_validators or decorators.model_validators or cls.model_config.get("strict")
+    )
+    # One TypeAdapter per field, built the first time the field is updated.
+    # None means the field can't get an adapter with the model config.
+    adapters: dict[str, Any] = {}
+
+    def validate_all(instance: T, updates: dict[str, Any]) -> dict[str, Any]:
         current = instance.model_dump()  # type: ignore
         current.update(updates)
         validated = instance.__class__.model_validate(current)  # type: ignore
         return {k: getattr(validated, k) for k in updates}
 
-    return add_dynamodb_methods(
-        cls, table, hash_key, range_key, client, to_dict, from_dict, validate_update
-    )
+    def validate_update(instance: T, updates: dict[str, Any]) -> dict[str, Any]:
+        if full_validation:
+            return validate_all(instance, updates)
+
+        result = {}
+        for name, value in updates.items():
+            adapter = adapters.get(name)
+            if adapter is None:
+                if name in adapters:
+                    return validate_all(instance, updates)
+                info = cls.model_fields.get(name)
+                if info is None:
+                    raise AttributeError(f"'{cls.__name__}' has no attribute '{name}'")
+                try:
+                    # The model config carries rules like str_strip_whitespace.
+                    # Annotated built at runtime is not a type mypy can check.
+                    adapter = TypeAdapter(
+                        Annotated[info.annotation, info],  # type: ignore[arg-type]
+                        config=cls.model_config,
+                    )
+                except PydanticUserError:
+                    # Pydantic refuses config= for BaseModel, dataclass and
+                    # TypedDict fields, so those go through model_validate
+                    adapters[name] = None
+                    return validate_all(instance, updates)
+                adapters[name] = adapter
+            result[name] = adapter.validate_python(value)
+        return result
+
+    return to_dict, from_dict, validate_update
+
+
+if BaseModel is not None:
+    # Only exported when pydantic is installed, since that's when it exists
+    __all__ += ["DynamoDBModel"]
+
+    class DynamoDBModel(BaseModel, DynamoDBMixin):
+        """Pydantic base class with DynamoDB methods.
+
+        Pass the table settings as class keywords instead of using the
+        decorator. The class is set up once when it is defined, and no
+        extra subclass is created.
+
+        Example:
+            >>> from pydynox.integrations.pydantic import DynamoDBModel
+            >>>
+            >>> class User(DynamoDBModel, table="users", hash_key="pk", range_key="sk"):
+            ...     pk: str
+            ...     sk: str
+            ...     name: str
+            >>>
+            >>> User(pk="USER#1", sk="PROFILE", name="John").save()
+
+        Subclasses without `table=` inherit the settings of their parent.
+        """
+
+        def __init_subclass__(
+            cls,
+            *,
+            table: str | None = None,
+            hash_key: str | None = None,
+            range_key: str | None = None,
+            client: DynamoDBClient | None = None,
+            **kwargs: Any,
+        ) -> None:
+            # Pydantic passes the class keywords here as well. They are
+            # used in __pydantic_init_subclass__ below.
+            super().__init_subclass__(**kwargs)
+
+        @classmethod
+        def __pydantic_init_subclass__(
+            cls,
+            *,
+            table: str | None = None,
+            hash_key: str | None = None,
+            range_key: str | None = None,
+            client: DynamoDBClient | None = None,
+            **kwargs: Any,
+        ) -> None:
+            # Runs after Pydantic has collected the fields, which the
+            # converters need. __init_subclass__ runs too early for that.
+            super().__pydantic_init_subclass__(**kwargs)
+            if table is None:
+                if not hasattr(cls, "_pydynox_table"):
+                    return
+                # Keep the parent's settings, but build the converters again
+                # so updates are checked against this class's fields
+                table = cls._pydynox_table
+                hash_key = cls._pydynox_hash_key
+                range_key = cls._pydynox_range_key
+                client = cls._pydynox_client
+            if hash_key is None:
+                raise TypeError(f"{cls.__name__} needs hash_key= when table= is set")
+            set_dynamodb_metadata(cls, table, hash_key, range_key, client, *_converters(cls))
@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generic, TypeVar
 
 from pydynox._internal._atomic import AtomicOp, serialize_atomic
+from pydynox._internal._codegen import (
+    GENERATED,
+    make_from_dict,
+    make_get_key,
+    make_init,
+    make_to_dict,
+)
 from pydynox._internal._metrics import OperationMetrics
 from pydynox.attributes import Attribute
 from pydynox.attributes.ttl import TTLAttribute
@@ -24,23 +34,8 @@ if TYPE_CHECKING:
 M = TypeVar("M", bound="Model")
 
 
-class ModelQueryResult(Generic[M]):
-    """Result of a Model.query() with automatic pagination.
-
-    Iterate over results to get typed model instances.
-    Access `last_evaluated_key` for manual pagination.
-    Access `metrics` for timing and capacity info.
-
-    Example:
-        >>> for user in User.query(pk="USER#123"):
-        ...     print(user.name)  # user is typed as User
-        >>>
-        >>> # Check metrics
-        >>> results = User.query(pk="USER#123")
-        >>> for user in results:
-        ...     pass
-        >>> print(results.metrics.duration_ms)
-    """
+class _ModelQueryBase(Generic[M]):
+    """State and query building shared by sync and async model queries."""
 
     def __init__(
         self,
@@ -64,7 +59,6 @@ class ModelQueryResult(Generic[M]):
 
         # Iteration state
         self._query_result: Any = None
-        self._items_iter: Any = None
         self._initialized = False
 
     @property
@@ -89,10 +83,28 @@ class ModelQueryResult(Generic[M]):
         metrics: OperationMetrics | None = self._query_result.metrics
         return metrics
 
-    def _build_query(self) -> Any:
-        """Build the underlying QueryResult."""
-        from pydynox.query import QueryResult
+    @property
+    def count(self) -> int:
+        """Number of items returned by the pages fetched so far."""
+        if self._query_result is None:
+            return 0
+        count: int = self._query_result.count
+        return count
+
+    @property
+    def scanned_count(self) -> int:
+        """Number of items DynamoDB read for the pages fetched so far."""
+        if self._query_result is None:
+            return 0
+        scanned_count: int = self._query_result.scanned_count
+        return scanned_count
+
+    def _query_args(self) -> tuple[Any, str, str, dict[str, Any]]:
+        """Build the arguments for QueryResult / AsyncQueryResult.
 
+        Returns:
+            Tuple of (client, table, key_condition, keyword arguments).
+        """
         client = self._model_class._get_client()
         table = self._model_class._get_table()
         hash_key_name = self._model_class._hash_key
@@ -130,20 +142,57 @@ class ModelQueryResult(Generic[M]):
         if use_consistent is None:
             use_consistent = getattr(self._model_class.model_config, "consistent_read", False)
 
-        return QueryResult(
-            client._client,
+        return (
+            client,
             table,
             key_condition,
-            filter_expression=filter_expr,
-            expression_attribute_names=attr_names if attr_names else None,
-            expression_attribute_values=values if values else None,
-            limit=self._limit,
-            scan_index_forward=self._scan_index_forward,
-            last_evaluated_key=self._start_key,
-            acquire_rcu=client._acquire_rcu,
-            consistent_read=use_consistent,
+            {
+                "filter_expression": filter_expr,
+                "expression_attribute_names": attr_names if attr_names else None,
+                "expression_attribute_values": values if values else None,
+                "limit": self._limit,
+                "scan_index_forward": self._scan_index_forward,
+                "last_evaluated_key": self._start_key,
+                "acquire_rcu": client._query_acquire_rcu,
+                "consistent_read": use_consistent,
+            },
         )
 
+    def _to_instance(self, item: dict[str, Any]) -> M:
+        """Convert a raw item to a model instance and run after_load hooks."""
+        instance = self._model_class.from_dict(item)
+        if self._model_class._has_after_load and not self._model_class._skip_hooks_default:
+            instance._fire_after_load()
+        return instance
+
+
+class ModelQueryResult(_ModelQueryBase[M]):
+    """Result of a Model.query() with automatic pagination.
+
+    Iterate over results to get typed model instances.
+    Access `last_evaluated_key` for manual pagination.
+    Access `metrics` for timing and capacity info.
+
+    Example:
+        >>> for user in User.query(pk="USER#123"):
+        ...     print(user.name)  # user is typed as User
+        >>>
+        >>> # Check metrics
+        >>> results = User.query(pk="USER#123")
+        >>> for user in results:
+        ...     pass
+        >>> print(results.metrics.duration_ms)
+    """
+
+    _items_iter: Any = None
+
+    def _build_query(self) -> Any:
+        """Build the underlying QueryResult."""
+        from pydynox.query import QueryResult
+
+        client, table, key_condition, kwargs = self._query_args()
+        return QueryResult(client._client, table, key_condition, **kwargs)
+
     def __iter__(self) -> ModelQueryResult[M]:
         return self
 
@@ -155,21 +204,7 @@ class ModelQueryResult(Generic[M]):
             self._initialized = True
 
         # Get next item from underlying query
-        item = next(self._items_iter)
-
-        # Convert to model instance
-        instance = self._model_class.from_dict(item)
-
-        # Run after_load hooks
-        skip = (
-            self._model_class.model_config.skip_hooks
-            if hasattr(self._model_class, "model_config")
-            else False
-        )
-        if not skip:
-            instance._run_hooks(HookType.AFTER_LOAD)
-
-        return instance
+        return self._to_instance(next(self._items_iter))
 
     def first(self) -> M | None:
         """Get the first result or None.
@@ -185,7 +220,7 @@ class ModelQueryResult(Generic[M]):
             return None
 
 
-class AsyncModelQueryResult(Generic[M]):
+class AsyncModelQueryResult(_ModelQueryBase[M]):
     """Async result of a Model.query() with automatic pagination.
 
     Use `async for` to iterate over results.
@@ -200,102 +235,12 @@ class AsyncModelQueryResult(Generic[M]):
         >>> user = await User.async_query(hash_key="USER#123").first()
     """
 
-    def __init__(
-        self,
-        model_class: type[M],
-        hash_key_value: Any,
-        range_key_condition: Condition | None = None,
-        filter_condition: Condition | None = None,
-        limit: int | None = None,
-        scan_index_forward: bool = True,
-        consistent_read: bool | None = None,
-        last_evaluated_key: dict[str, Any] | None = None,
-    ) -> None:
-        self._model_class = model_class
-        self._hash_key_value = hash_key_value
-        self._range_key_condition = range_key_condition
-        self._filter_condition = filter_condition
-        self._limit = limit
-        self._scan_index_forward = scan_index_forward
-        self._consistent_read = consistent_read
-        self._start_key = last_evaluated_key
-
-        # Iteration state
-        self._query_result: Any = None
-        self._initialized = False
-        self._current_page: list[dict[str, Any]] = []
-        self._page_index = 0
-
-    @property
-    def last_evaluated_key(self) -> dict[str, Any] | None:
-        """The last evaluated key for pagination."""
-        if self._query_result is None:
-            return None
-        result: dict[str, Any] | None = self._query_result.last_evaluated_key
-        return result
-
-    @property
-    def metrics(self) -> OperationMetrics | None:
-        """Metrics from the last page fetch."""
-        if self._query_result is None:
-            return None
-        metrics: OperationMetrics | None = self._query_result.metrics
-        return metrics
-
     def _build_query(self) -> Any:
         """Build the underlying AsyncQueryResult."""
         from pydynox.query import AsyncQueryResult
 
-        client = self._model_class._get_client()
-        table = self._model_class._get_table()
-        hash_key_name = self._model_class._hash_key
-
-        if hash_key_name is None:
-            raise ValueError(f"Model {self._model_class.__name__} has no hash key defined")
-
-        # Build key condition expression
-        names: dict[str, str] = {}
-        values: dict[str, Any] = {}
-
-        # Hash key condition
-        hk_name_placeholder = "#pk"
-        hk_value_placeholder = ":pkv"
-        names[hash_key_name] = hk_name_placeholder
-        values[hk_value_placeholder] = self._hash_key_value
-
-        key_condition = f"{hk_name_placeholder} = {hk_value_placeholder}"
-
-        # Add range key condition if provided
-        if self._range_key_condition is not None:
-            rk_expr = self._range_key_condition.serialize(names, values)
-            key_condition = f"{key_condition} AND {rk_expr}"
-
-        # Build filter expression if provided
-        filter_expr = None
-        if self._filter_condition is not None:
-            filter_expr = self._filter_condition.serialize(names, values)
-
-        # Convert names to DynamoDB format
-        attr_names = {placeholder: attr_name for attr_name, placeholder in names.items()}
-
-        # Determine consistent_read
-        use_consistent = self._consistent_read
-        if use_consistent is None:
-            use_consistent = getattr(self._model_class.model_config, "consistent_read", False)
-
-        return AsyncQueryResult(
-            client._client,
-            table,
-            key_condition,
-            filter_expression=filter_expr,
-            expression_attribute_names=attr_names if attr_names else None,
-            expression_attribute_values=values if values else None,
-            limit=self._limit,
-            scan_index_forward=self._scan_index_forward,
-            last_evaluated_key=self._start_key,
-            acquire_rcu=client._acquire_rcu,
-            consistent_read=use_consistent,
-        )
+        client, table, key_condition, kwargs = self._query_args()
+        return AsyncQueryResult(client._client, table, key_condition, **kwargs)
 
     def __aiter__(self) -> AsyncModelQueryResult[M]:
         return self
@@ -307,24 +252,8 @@ class AsyncModelQueryResult(Generic[M]):
             self._initialized = True
 
         # Get next item from underlying query
-        try:
-            item = await self._query_result.__anext__()
-        except StopAsyncIteration:
-            raise
-
-        # Convert to model instance
-        instance = self._model_class.from_dict(item)
-
-        # Run after_load hooks
-        skip = (
-            self._model_class.model_config.skip_hooks
-            if hasattr(self._model_class, "model_config")
-            else False
-        )
-        if not skip:
-            instance._run_hooks(HookType.AFTER_LOAD)
-
-        return instance
+        item = await self._query_result.__anext__()
+        return self._to_instance(item)
 
     async def first(self) -> M | None:
         """Get the first result or None.
@@ -338,73 +267,145 @@ class AsyncModelQueryResult(Generic[M]):
             return None
 
 
-class ModelMeta(type):
-    """Metaclass that collects attributes and builds schema."""
-
-    _attributes: dict[str, Attribute[Any]]
-    _hash_key: str | None
-    _range_key: str | None
-    _hooks: dict[HookType, list[Any]]
-    _indexes: dict[str, GlobalSecondaryIndex[Any]]
-
-    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any]) -> ModelMeta:
-        # Collect attributes from parent classes
-        attributes: dict[str, Attribute[Any]] = {}
-        hash_key: str | None = None
-        range_key: str | None = None
-        hooks: dict[HookType, list[Any]] = {hook_type: [] for hook_type in HookType}
-        indexes: dict[str, GlobalSecondaryIndex[Any]] = {}
-
-        for base in bases:
-            if hasattr(base, "_attributes"):
-                attributes.update(base._attributes)
-            if hasattr(base, "_hash_key") and base._hash_key:
-                hash_key = base._hash_key
-            if hasattr(base, "_range_key") and base._range_key:
-                range_key = base._range_key
-            if hasattr(base, "_hooks"):
-                for hook_type, hook_list in base._hooks.items():
-                    hooks[hook_type].extend(hook_list)
-            if hasattr(base, "_indexes"):
-                indexes.update(base._indexes)
-
-        # Collect attributes, hooks, and indexes from this class
-        for attr_name, attr_value in namespace.items():
-            if isinstance(attr_value, Attribute):
-                attr_value.attr_name = attr_name
-                attributes[attr_name] = attr_value
-
-                if attr_value.hash_key:
-                    hash_key = attr_name
-                if attr_value.range_key:
-                    range_key = attr_name
-
-            # Collect hooks
-            if callable(attr_value) and hasattr(attr_value, "_hook_type"):
-                hooks[getattr(attr_value, "_hook_type")].append(attr_value)
-
-            # Collect GSIs
-            if isinstance(attr_value, GlobalSecondaryIndex):
-                indexes[attr_name] = attr_value
-
-        # Create the class
-        cls = super().__new__(mcs, name, bases, namespace)
-
-        # Store metadata
-        cls._attributes = attributes
-        cls._hash_key = hash_key
-        cls._range_key = range_key
-        cls._hooks = hooks
-        cls._indexes = indexes
-
-        # Bind indexes to this model class
-        for idx in indexes.values():
-            idx._bind_to_model(cls)
-
-        return cls
-
-
-class Model(metaclass=ModelMeta):
+def _collect_attributes_and_hooks(cls: type[Model]) -> None:
+    """Collect attributes, keys, hooks and indexes into class metadata.
+
+    Called from Model.__init_subclass__ for every model class.
+    """
+    # Collect attributes from parent classes
+    attributes: dict[str, Attribute[Any]] = {}
+    hash_key: str | None = None
+    range_key: str | None = None
+    hooks: dict[HookType, list[Any]] = {hook_type: [] for hook_type in HookType}
+    indexes: dict[str, GlobalSecondaryIndex[Any]] = {}
+
+    # Only model bases carry metadata. Each one already merged its own
+    # parents, so one level is enough. For the root Model this is empty.
+    model_bases = [base for base in cls.__bases__ if issubclass(base, Model)]
+    for base in model_bases:
+        attributes.update(base._attributes)
+        if base._hash_key:
+            hash_key = base._hash_key
+        if base._range_key:
+            range_key = base._range_key
+        for hook_type, hook_list in base._hooks.items():
+            if hook_list:
+                hooks[hook_type].extend(hook_list)
+        indexes.update(base._indexes)
+
+    # Collect attributes, hooks, and indexes from this class
+    for attr_name, attr_value in cls.__dict__.items():
+        if isinstance(attr_value, Attribute):
+            attr_value.attr_name = attr_name
+            attributes[attr_name] = attr_value
+
+            if attr_value.hash_key:
+                hash_key = attr_name
+            if attr_value.range_key:
+                range_key = attr_name
+
+        # Collect hooks
+        if callable(attr_value) and hasattr(attr_value, "_hook_type"):
+            hooks[getattr(attr_value, "_hook_type")].append(attr_value)
+
+        # Collect GSIs
+        if isinstance(attr_value, GlobalSecondaryIndex):
+            indexes[attr_name] = attr_value
+
+    # Store metadata
+    cls._attributes = attributes
+    cls._hash_key = hash_key
+    cls._range_key = range_key
+    cls._key_attrs = tuple(key for key in (hash_key, range_key) if key)
+    cls._key_getter = _make_key_getter(cls._key_attrs)
+    cls._hooks = hooks
+    # Read-only, so a subclass can't change the indexes of its parent
+    cls._indexes = MappingProxyType(indexes)
+
+    # One runner per hook type (_fire_before_save, ...), so CRUD methods
+    # call it directly instead of looking up the hook list each time
+    for hook_type, hook_list in hooks.items():
+        setattr(cls, f"_fire_{hook_type.value}", _make_hook_runner(tuple(hook_list)))
+        # Checked before the runner, so models without hooks skip the call
+        setattr(cls, f"_has_{hook_type.value}", bool(hook_list))
+
+    # Read once here so CRUD calls don't look up model_config every time
+    config = getattr(cls, "model_config", None)
+    cls._skip_hooks_default = config.skip_hooks if config is not None else False
+
+    # Bind indexes to this model class
+    for idx in indexes.values():
+        idx._bind_to_model(cls)
+
+    # Build __init__, _get_key, to_dict and from_dict for this class, unless
+    # the user wrote their own
+    if cls is not Model:
+        default_init = _uses_generated(cls, "__init__")
+        if default_init:
+            init = make_init(cls, attributes, Model.__init__)
+            setattr(cls, "__init__", init if init is not None else Model.__init__)
+        if _uses_generated(cls, "_get_key"):
+            get_key = make_get_key(cls, cls._key_attrs, Model._get_key)
+            if get_key is not None:
+                setattr(cls, "_get_key", get_key)
+        if _uses_generated(cls, "to_dict"):
+            to_dict = make_to_dict(cls, attributes, Model.to_dict)
+            if to_dict is not None:
+                setattr(cls, "to_dict", to_dict)
+        if _uses_generated(cls, "from_dict"):
+            # The generated from_dict skips __init__, so only use it when
+            # the class keeps the default __init__ and __new__
+            from_dict = None
+            if default_init and cls.__new__ is object.__new__:
+                from_dict = make_from_dict(cls, attributes, Model.__dict__["from_dict"].__func__)
+            if from_dict is not None:
+                method = classmethod(from_dict)
+                setattr(method, GENERATED, True)
+                setattr(cls, "from_dict", method)
+            else:
+                setattr(cls, "from_dict", Model.__dict__["from_dict"])
+
+
+def _make_key_getter(key_attrs: tuple[str, ...]) -> Callable[[Any], Any]:
+    """Build a function that reads the key values from an instance.
+
+    Returns a single value for one key and a tuple for two.
+    """
+    if not key_attrs:
+        return _no_key
+    return attrgetter(*key_attrs)
+
+
+def _no_key(instance: Any) -> tuple[()]:
+    return ()
+
+
+def _make_hook_runner(hooks: tuple[Any, ...]) -> Callable[[Any], None]:
+    """Build a method that calls each hook with the instance."""
+    if not hooks:
+
+        def run_no_hooks(self: Any) -> None:
+            return None
+
+        return run_no_hooks
+
+    def run_hooks(self: Any) -> None:
+        for hook in hooks:
+            hook(self)
+
+    return run_hooks
+
+
+def _uses_generated(cls: type, name: str) -> bool:
+    """Check if `name` comes from the root Model or from generated code."""
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            value = klass.__dict__[name]
+            return getattr(value, GENERATED, False) or value is Model.__dict__.get(name)
+    return False
+
+
+class Model:
     """Base class for DynamoDB models with ORM-style CRUD.
 
     Define your model by subclassing and adding attributes:
@@ -451,12 +452,33 @@ class Model(metaclass=ModelMeta):
     _attributes: ClassVar[dict[str, Attribute[Any]]]
     _hash_key: ClassVar[str | None]
     _range_key: ClassVar[str | None]
+    _key_attrs: ClassVar[tuple[str, ...]]
+    _key_getter: ClassVar[Callable[[Any], Any]]
     _hooks: ClassVar[dict[HookType, list[Any]]]
-    _indexes: ClassVar[dict[str, GlobalSecondaryIndex[Any]]]
+    _indexes: ClassVar[Mapping[str, GlobalSecondaryIndex[Any]]]
+    _skip_hooks_default: ClassVar[bool]
+    _fire_before_save: ClassVar[Callable[[Any], None]]
+    _fire_after_save: ClassVar[Callable[[Any], None]]
+    _fire_before_delete: ClassVar[Callable[[Any], None]]
+    _fire_after_delete: ClassVar[Callable[[Any], None]]
+    _fire_before_update: ClassVar[Callable[[Any], None]]
+    _fire_after_update: ClassVar[Callable[[Any], None]]
+    _fire_after_load: ClassVar[Callable[[Any], None]]
+    _has_before_save: ClassVar[bool]
+    _has_after_save: ClassVar[bool]
+    _has_before_delete: ClassVar[bool]
+    _has_after_delete: ClassVar[bool]
+    _has_before_update: ClassVar[bool]
+    _has_after_update: ClassVar[bool]
+    _has_after_load: ClassVar[bool]
     _client_instance: ClassVar[DynamoDBClient | None] = None
 
     model_config: ClassVar[ModelConfig]
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _collect_attributes_and_hooks(cls)
+
     def __init__(self, **kwargs: Any):
         """Create a model instance.
 
@@ -529,11 +551,7 @@ class Model(metaclass=ModelMeta):
 
     def _should_skip_hooks(self, skip_hooks: bool | None) -> bool:
         """Check if hooks should be skipped."""
-        if skip_hooks is not None:
-            return skip_hooks
-        if hasattr(self, "model_config"):
-            return self.model_config.skip_hooks
-        return False
+        return self._skip_hooks_default if skip_hooks is None else skip_hooks
 
     def _run_hooks(self, hook_type: HookType) -> None:
         """Run all hooks of the given type."""
@@ -573,9 +591,8 @@ class Model(metaclass=ModelMeta):
             return None
 
         instance = cls.from_dict(item)
-        skip = cls.model_config.skip_hooks if hasattr(cls, "model_config") else False
-        if not skip:
-            instance._run_hooks(HookType.AFTER_LOAD)
+        if cls._has_after_load and not cls._skip_hooks_default:
+            instance._fire_after_load()
         return instance
 
     @classmethod
@@ -687,7 +704,7 @@ class Model(metaclass=ModelMeta):
             parameters=parameters,
             consistent_read=consistent_read,
         )
-        return [cls.from_dict(item) for item in result]
+        return cls._deserialize_batch(result)
 
     @classmethod
     async def async_execute_statement(
@@ -718,7 +735,7 @@ class Model(metaclass=ModelMeta):
             parameters=parameters,
             consistent_read=consistent_read,
         )
-        return [cls.from_dict(item) for item in result]
+        return cls._deserialize_batch(result)
 
     def save(self, condition: Condition | None = None, skip_hooks: bool | None = None) -> None:
         """Save the model to DynamoDB.
@@ -753,8 +770,8 @@ class Model(metaclass=ModelMeta):
         """
         skip = self._should_skip_hooks(skip_hooks)
 
-        if not skip:
-            self._run_hooks(HookType.BEFORE_SAVE)
+        if not skip and self._has_before_save:
+            self._fire_before_save()
 
         # Apply auto-generate strategies before saving
         self._apply_auto_generate()
@@ -776,17 +793,7 @@ class Model(metaclass=ModelMeta):
             setattr(self, version_attr, new_version)
 
         # Check size if max_size is set
-        max_size = (
-            getattr(self.model_config, "max_size", None) if hasattr(self, "model_config") else None
-        )
-        if max_size is not None:
-            size = self.calculate_size()
-            if size.bytes > max_size:
-                raise ItemTooLargeError(
-                    size=size.bytes,
-                    max_size=max_size,
-                    item_key=self._get_key(),
-                )
+        self._check_size()
 
         client = self._get_client()
         table = self._get_table()
@@ -809,8 +816,8 @@ class Model(metaclass=ModelMeta):
         else:
             client.put_item(table, item)
 
-        if not skip:
-            self._run_hooks(HookType.AFTER_SAVE)
+        if not skip and self._has_after_save:
+            self._fire_after_save()
 
     def delete(self, condition: Condition | None = None, skip_hooks: bool | None = None) -> None:
         """Delete the model from DynamoDB.
@@ -835,8 +842,8 @@ class Model(metaclass=ModelMeta):
         """
         skip = self._should_skip_hooks(skip_hooks)
 
-        if not skip:
-            self._run_hooks(HookType.BEFORE_DELETE)
+        if not skip and self._has_before_delete:
+            self._fire_before_delete()
 
         # Handle optimistic locking for delete
         version_attr = self._get_version_attr_name()
@@ -877,8 +884,8 @@ class Model(metaclass=ModelMeta):
         else:
             client.delete_item(table, key)
 
-        if not skip:
-            self._run_hooks(HookType.AFTER_DELETE)
+        if not skip and self._has_after_delete:
+            self._fire_after_delete()
 
     def update(
         self,
@@ -920,8 +927,8 @@ class Model(metaclass=ModelMeta):
         """
         skip = self._should_skip_hooks(skip_hooks)
 
-        if not skip:
-            self._run_hooks(HookType.BEFORE_UPDATE)
+        if not skip and self._has_before_update:
+            self._fire_before_update()
 
         client = self._get_client()
         table = self._get_table()
@@ -976,8 +983,159 @@ class Model(metaclass=ModelMeta):
             else:
                 client.update_item(table, key, updates=kwargs)
 
-        if not skip:
-            self._run_hooks(HookType.AFTER_UPDATE)
+        if not skip and self._has_after_update:
+            self._fire_after_update()
+
+    @classmethod
+    def batch_save(cls: type[M], items: Iterable[M], skip_hooks: bool | None = None) -> None:
+        """Save many items using BatchWriteItem.
+
+        Items are sent in groups of 25 and unprocessed items are retried
+        with exponential backoff. Much faster than calling save() in a loop.
+
+        Batch writes don't support conditions, so models with a
+        VersionAttribute must use save() instead.
+
+        Args:
+            items: Model instances to save.
+            skip_hooks: Skip hooks for this operation. If None, uses model_config.skip_hooks.
+
+        Raises:
+            ValueError: If the model has a VersionAttribute.
+            ItemTooLargeError: If max_size is set and an item exceeds it.
+
+        Example:
+            >>> users = [User(pk=f"USER#{i}", sk="PROFILE") for i in range(100)]
+            >>> User.batch_save(users)  # 4 requests instead of 100
+        """
+        items = list(items)
+        if not items:
+            return
+
+        if items[0]._get_version_attr_name() is not None:
+            raise ValueError(
+                f"Model {cls.__name__} has a VersionAttribute. Use save() instead of batch_save()"
+            )
+
+        skip = cls._skip_hooks_default if skip_hooks is None else skip_hooks
+
+        if not skip and cls._has_before_save:
+            for instance in items:
+                instance._fire_before_save()
+
+        put_items = []
+        for instance in items:
+            instance._apply_auto_generate()
+            instance._check_size()
+            put_items.append(instance.to_dict())
+
+        cls._get_client().batch_write(cls._get_table(), put_items=put_items)
+
+        if not skip and cls._has_after_save:
+            for instance in items:
+                instance._fire_after_save()
+
+    @classmethod
+    def batch_delete(cls: type[M], items: Iterable[M], skip_hooks: bool | None = None) -> None:
+        """Delete many items using BatchWriteItem.
+
+        Keys are sent in groups of 25 and unprocessed keys are retried
+        with exponential backoff.
+
+        Args:
+            items: Model instances to delete.
+            skip_hooks: Skip hooks for this operation. If None, uses model_config.skip_hooks.
+
+        Example:
+            >>> users = list(User.query(hash_key="TENANT#1"))
+            >>> User.batch_delete(users)
+        """
+        items = list(items)
+        if not items:
+            return
+
+        skip = cls._skip_hooks_default if skip_hooks is None else skip_hooks
+
+        if not skip and cls._has_before_delete:
+            for instance in items:
+                instance._fire_before_delete()
+
+        delete_keys = [instance._get_key() for instance in items]
+        cls._get_client().batch_write(cls._get_table(), delete_keys=delete_keys)
+
+        if not skip and cls._has_after_delete:
+            for instance in items:
+                instance._fire_after_delete()
+
+    @classmethod
+    def batch_get(cls: type[M], keys: list[dict[str, Any]]) -> list[M]:
+        """Get many items by key using BatchGetItem.
+
+        Keys are sent in groups of 100 and unprocessed keys are retried
+        with exponential backoff.
+
+        Args:
+            keys: List of key dicts (hash_key and optional range_key).
+
+        Returns:
+            List of model instances that were found. Missing items are not
+            included, and the order may not match the order of keys.
+
+        Example:
+            >>> users = User.batch_get([
+            ...     {"pk": "USER#1", "sk": "PROFILE"},
+            ...     {"pk": "USER#2", "sk": "PROFILE"},
+            ... ])
+        """
+        if not keys:
+            return []
+
+        return cls._load_batch(cls._get_client().batch_get(cls._get_table(), keys))
+
+    @classmethod
+    def _load_batch(cls: type[M], items: list[dict[str, Any]]) -> list[M]:
+        """Deserialize batch_get rows and run after_load hooks."""
+        instances = cls._deserialize_batch(items)
+        if cls._has_after_load and not cls._skip_hooks_default:
+            for instance in instances:
+                instance._fire_after_load()
+        return instances
+
+    @classmethod
+    def get_many(cls: type[M], keys: list[dict[str, Any]]) -> list[M | None]:
+        """Get many items by key, in the same order as keys.
+
+        Like batch_get (one BatchGetItem per 100 keys instead of one
+        GetItem per key), but the result lines up with keys and has None
+        where an item was not found.
+
+        Args:
+            keys: List of key dicts (hash_key and optional range_key).
+
+        Returns:
+            One model instance or None per key.
+
+        Example:
+            >>> user1, user2 = User.get_many([
+            ...     {"pk": "USER#1", "sk": "PROFILE"},
+            ...     {"pk": "USER#2", "sk": "PROFILE"},
+            ... ])
+        """
+        if not keys:
+            return []
+
+        items = cls._get_client().batch_get(cls._get_table(), keys)
+        instances = cls._load_batch(items)
+
+        # Match on the rows as DynamoDB sent them, not on the deserialized
+        # values: the keys are sent as given, so a datetime or number key
+        # comes back in the same form the caller used.
+        key_attrs = cls._key_attrs
+        found = {
+            tuple(item.get(name) for name in key_attrs): instance
+            for item, instance in zip(items, instances)
+        }
+        return [found.get(tuple(key[name] for name in key_attrs)) for key in keys]
 
     def _get_key(self) -> dict[str, Any]:
         """Get the key dict for this instance."""
@@ -999,13 +1157,29 @@ class Model(metaclass=ModelMeta):
             >>> user.to_dict()
             {'pk': 'USER#123', 'sk': 'PROFILE', 'name': 'John'}
         """
+        # Values live in the instance dict, read it directly instead of getattr()
+        values = self.__dict__
         result = {}
         for attr_name, attr in self._attributes.items():
-            value = getattr(self, attr_name, None)
+            value = values.get(attr_name)
             if value is not None:
                 result[attr_name] = attr.serialize(value)
         return result
 
+    def _check_size(self) -> None:
+        """Raise ItemTooLargeError if the item is over model_config.max_size."""
+        max_size = (
+            getattr(self.model_config, "max_size", None) if hasattr(self, "model_config") else None
+        )
+        if max_size is not None:
+            size = self.calculate_size()
+            if size.bytes > max_size:
+                raise ItemTooLargeError(
+                    size=size.bytes,
+                    max_size=max_size,
+                    item_key=self._get_key(),
+                )
+
     def calculate_size(self, detailed: bool = False) -> ItemSize:
         """Calculate the size of this item in bytes.
 
@@ -1053,6 +1227,30 @@ class Model(metaclass=ModelMeta):
                 deserialized[attr_name] = value
         return cls(**deserialized)
 
+    @classmethod
+    def _deserialize_batch(cls: type[M], rows: Iterable[dict[str, Any]]) -> list[M]:
+        """Create model instances from many dicts.
+
+        Same result as calling from_dict for each row, but the deserialize
+        methods are looked up once for the whole batch.
+        """
+        # mypy types cls.from_dict as a plain callable, but on a class a
+        # classmethod is always a bound method, so it has __func__
+        if cls.from_dict.__func__ is not Model.from_dict.__func__:  # type: ignore[attr-defined]
+            # from_dict was generated for this class or written by the user
+            return [cls.from_dict(row) for row in rows]
+
+        deserializers = {name: attr.deserialize for name, attr in cls._attributes.items()}
+        get_deserializer = deserializers.get
+        instances = []
+        for row in rows:
+            data = {}
+            for attr_name, value in row.items():
+                deserialize = get_deserializer(attr_name)
+                data[attr_name] = value if deserialize is None else deserialize(value)
+            instances.append(cls(**data))
+        return instances
+
     def __repr__(self) -> str:
         """Return a string representation of the model."""
         attrs = ", ".join(f"{k}={v!r}" for k, v in self.to_dict().items())
@@ -1062,7 +1260,13 @@ class Model(metaclass=ModelMeta):
         """Check equality based on key attributes."""
         if not isinstance(other, self.__class__):
             return False
-        return self._get_key() == other._get_key()
+        # Read from the class: attrgetter doesn't bind to the instance
+        key_getter = type(self)._key_getter
+        return bool(key_getter(self) == key_getter(other))
+
+    def __hash__(self) -> int:
+        """Hash based on key attributes, so instances work in sets and dicts."""
+        return hash(type(self)._key_getter(self))
 
     def _get_ttl_attr_name(self) -> str | None:
         """Find the TTLAttribute field name if one exists."""
@@ -1212,9 +1416,8 @@ class Model(metaclass=ModelMeta):
             return None
 
         instance = cls.from_dict(item)
-        skip = cls.model_config.skip_hooks if hasattr(cls, "model_config") else False
-        if not skip:
-            instance._run_hooks(HookType.AFTER_LOAD)
+        if cls._has_after_load and not cls._skip_hooks_default:
+            instance._fire_after_load()
         return instance
 
     @classmethod
@@ -1275,8 +1478,8 @@ class Model(metaclass=ModelMeta):
         """
         skip = self._should_skip_hooks(skip_hooks)
 
-        if not skip:
-            self._run_hooks(HookType.BEFORE_SAVE)
+        if not skip and self._has_before_save:
+            self._fire_before_save()
 
         # Apply auto-generate strategies before saving
         self._apply_auto_generate()
@@ -1298,17 +1501,7 @@ class Model(metaclass=ModelMeta):
             setattr(self, version_attr, new_version)
 
         # Check size if max_size is set
-        max_size = (
-            getattr(self.model_config, "max_size", None) if hasattr(self, "model_config") else None
-        )
-        if max_size is not None:
-            size = self.calculate_size()
-            if size.bytes > max_size:
-                raise ItemTooLargeError(
-                    size=size.bytes,
-                    max_size=max_size,
-                    item_key=self._get_key(),
-                )
+        self._check_size()
 
         client = self._get_client()
         table = self._get_table()
@@ -1329,8 +1522,8 @@ class Model(metaclass=ModelMeta):
         else:
             await client.async_put_item(table, item)
 
-        if not skip:
-            self._run_hooks(HookType.AFTER_SAVE)
+        if not skip and self._has_after_save:
+            self._fire_after_save()
 
     async def async_delete(
         self, condition: Condition | None = None, skip_hooks: bool | None = None
@@ -1347,8 +1540,8 @@ class Model(metaclass=ModelMeta):
         """
         skip = self._should_skip_hooks(skip_hooks)
 
-        if not skip:
-            self._run_hooks(HookType.BEFORE_DELETE)
+        if not skip and self._has_before_delete:
+            self._fire_before_delete()
 
         # Handle optimistic locking for delete
         version_attr = self._get_version_attr_name()
@@ -1388,8 +1581,8 @@ class Model(metaclass=ModelMeta):
         else:
             await client.async_delete_item(table, key)
 
-        if not skip:
-            self._run_hooks(HookType.AFTER_DELETE)
+        if not skip and self._has_after_delete:
+            self._fire_after_delete()
 
     async def async_update(
         self,
@@ -1412,8 +1605,8 @@ class Model(metaclass=ModelMeta):
         """
         skip = self._should_skip_hooks(skip_hooks)
 
-        if not skip:
-            self._run_hooks(HookType.BEFORE_UPDATE)
+        if not skip and self._has_before_update:
+            self._fire_before_update()
 
         client = self._get_client()
         table = self._get_table()
@@ -1460,5 +1653,9 @@ class Model(metaclass=ModelMeta):
             else:
                 await client.async_update_item(table, key, updates=kwargs)
 
-        if not skip:
-            self._run_hooks(HookType.AFTER_UPDATE)
+        if not skip and self._has_after_update:
+            self._fire_after_update()
+
+
+# The root Model needs the same metadata as its subclasses
+_collect_attributes_and_hooks(Model)
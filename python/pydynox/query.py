@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+import threading
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from pydynox._internal._logging import _log_operation, _log_warning
@@ -14,6 +17,43 @@ if TYPE_CHECKING:
 # Threshold for slow query warning (ms)
 _SLOW_QUERY_THRESHOLD_MS = 100.0
 
+# Marks the end of the current page in next() calls
+_SENTINEL: Any = object()
+
+# Shared by all queries with prefetch=True, created on first use
+_prefetch_executor: ThreadPoolExecutor | None = None
+_prefetch_lock = threading.Lock()
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Get the thread pool used to fetch the next page in the background."""
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        with _prefetch_lock:
+            if _prefetch_executor is None:
+                _prefetch_executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="pydynox-prefetch"
+                )
+    return _prefetch_executor
+
+
+def _estimate_rcu(limit: int | None, consistent_read: bool) -> float:
+    """Guess the RCU a query page will use before sending it.
+
+    One RCU reads one item (up to 4 KB) with a consistent read, or two items
+    with an eventually consistent read.
+    """
+    per_item = 1.0 if consistent_read else 0.5
+    return limit * per_item if limit else per_item
+
+
+def _extra_rcu(estimate: float, metrics: OperationMetrics) -> float:
+    """The RCU a page used beyond the estimate, to acquire after the request."""
+    consumed = metrics.consumed_rcu
+    if consumed is not None and consumed > estimate:
+        return consumed - estimate
+    return 0.0
+
 
 class QueryResult:
     """Result of a DynamoDB query with automatic pagination.
@@ -21,6 +61,10 @@ class QueryResult:
     Iterate over results and access `last_evaluated_key` for manual pagination.
     Access `metrics` for timing and capacity info from the last page fetch.
 
+    With `prefetch=True`, the next page is requested in a background thread
+    as soon as a page arrives, so the network wait overlaps with your loop.
+    This costs one extra request if you stop before the last page.
+
     Example:
         >>> results = client.query("users", key_condition_expression="pk = :pk", ...)
         >>> for item in results:
@@ -31,6 +75,26 @@ class QueryResult:
         >>> print(results.metrics.consumed_rcu)
     """
 
+    __slots__ = (
+        "_client",
+        "_table",
+        "_key_condition_expression",
+        "_query_kwargs",
+        "_limit",
+        "_next_start_key",
+        "_acquire_rcu",
+        "_consistent_read",
+        "_current_page",
+        "_gen",
+        "_last_evaluated_key",
+        "_exhausted",
+        "_metrics",
+        "_count",
+        "_scanned_count",
+        "_prefetch",
+        "_prefetch_future",
+    )
+
     def __init__(
         self,
         client: pydynox_core.DynamoDBClient,
@@ -45,26 +109,36 @@ class QueryResult:
         last_evaluated_key: dict[str, Any] | None = None,
         acquire_rcu: Callable[[float], None] | None = None,
         consistent_read: bool = False,
+        prefetch: bool = False,
     ):
         self._client = client
         self._table = table
         self._key_condition_expression = key_condition_expression
-        self._filter_expression = filter_expression
-        self._expression_attribute_names = expression_attribute_names
-        self._expression_attribute_values = expression_attribute_values
+        # Built once, only the start key changes between pages
+        self._query_kwargs: dict[str, Any] = {
+            "filter_expression": filter_expression,
+            "expression_attribute_names": expression_attribute_names,
+            "expression_attribute_values": expression_attribute_values,
+            "limit": limit,
+            "scan_index_forward": scan_index_forward,
+            "index_name": index_name,
+            "consistent_read": consistent_read,
+        }
         self._limit = limit
-        self._scan_index_forward = scan_index_forward
-        self._index_name = index_name
-        self._start_key = last_evaluated_key
+        # Start key for the next request. None after the first request means done.
+        self._next_start_key = last_evaluated_key
         self._acquire_rcu = acquire_rcu
         self._consistent_read = consistent_read
 
         self._current_page: list[dict[str, Any]] = []
-        self._page_index = 0
+        self._gen: Iterator[dict[str, Any]] | None = None
         self._last_evaluated_key: dict[str, Any] | None = None
         self._exhausted = False
-        self._first_fetch = True
         self._metrics: OperationMetrics | None = None
+        self._count = 0
+        self._scanned_count = 0
+        self._prefetch = prefetch
+        self._prefetch_future: Future[Any] | None = None
 
     @property
     def last_evaluated_key(self) -> dict[str, Any] | None:
@@ -84,62 +158,76 @@ class QueryResult:
         """
         return self._metrics
 
-    def __iter__(self) -> "QueryResult":
-        return self
+    @property
+    def count(self) -> int:
+        """Number of items returned by the pages fetched so far.
+
+        Uses the count DynamoDB sends with each page. Read it after
+        iterating to count items without keeping them in a list.
+        """
+        return self._count
+
+    @property
+    def scanned_count(self) -> int:
+        """Number of items DynamoDB read for the pages fetched so far.
+
+        Higher than `count` when a filter expression dropped items.
+        """
+        return self._scanned_count
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        # Hand out one shared generator, so `for` loops run on the fast
+        # generator path and next(result) continues from the same place
+        if self._gen is None:
+            self._gen = self._iterate()
+        return self._gen
 
     def __next__(self) -> dict[str, Any]:
-        # If we have items in current page, return next one
-        if self._page_index < len(self._current_page):
-            item = self._current_page[self._page_index]
-            self._page_index += 1
-            return item
+        return next(iter(self))
 
-        # If exhausted, stop
-        if self._exhausted:
-            raise StopIteration
+    def pages(self) -> Generator[list[dict[str, Any]], None, None]:
+        """Iterate page by page instead of item by item.
 
-        # Fetch next page
-        self._fetch_next_page()
+        Each page is the list of items from one request. Use it on a new
+        result, not one you already started iterating item by item.
 
-        # If no items after fetch, stop
-        if not self._current_page:
-            raise StopIteration
+        Example:
+            >>> for page in client.query("users", ...).pages():
+            ...     print(len(page))
+        """
+        while not self._exhausted:
+            self._fetch_next_page()
+            page, self._current_page = self._current_page, []
+            yield page
 
-        item = self._current_page[self._page_index]
-        self._page_index += 1
-        return item
+    def _iterate(self) -> Generator[dict[str, Any], None, None]:
+        while True:
+            yield from self._current_page
 
-    def _fetch_next_page(self) -> None:
-        """Fetch the next page of results from DynamoDB."""
-        # Don't fetch if we know there are no more pages
-        if not self._first_fetch and self._last_evaluated_key is None:
-            self._exhausted = True
-            return
+            # If exhausted, stop
+            if self._exhausted:
+                return
 
-        # Use start_key on first fetch, then last_evaluated_key
-        start_key = self._start_key if self._first_fetch else self._last_evaluated_key
-        self._first_fetch = False
+            # Fetch next page. It can be empty when a filter removed every
+            # item, so keep going until we get items or run out of pages.
+            self._fetch_next_page()
 
-        # Acquire RCU before fetching (estimate based on limit or default)
-        if self._acquire_rcu is not None:
-            rcu_estimate = float(self._limit) if self._limit else 1.0
-            self._acquire_rcu(rcu_estimate)
+    def _fetch_next_page(self) -> None:
+        """Fetch the next page of results from DynamoDB."""
+        # Drop the finished page first, so it can be freed during the request
+        self._current_page = []
 
-        items, self._last_evaluated_key, self._metrics = self._client.query_page(
-            self._table,
-            self._key_condition_expression,
-            filter_expression=self._filter_expression,
-            expression_attribute_names=self._expression_attribute_names,
-            expression_attribute_values=self._expression_attribute_values,
-            limit=self._limit,
-            exclusive_start_key=start_key,
-            scan_index_forward=self._scan_index_forward,
-            index_name=self._index_name,
-            consistent_read=self._consistent_read,
-        )
+        # Use the page fetched in the background, if there is one
+        if self._prefetch_future is not None:
+            future, self._prefetch_future = self._prefetch_future, None
+            items, self._last_evaluated_key, self._metrics = future.result()
+        else:
+            items, self._last_evaluated_key, self._metrics = self._query_page(self._next_start_key)
 
         self._current_page = items
-        self._page_index = 0
+        self._next_start_key = self._last_evaluated_key
+        self._count += self._metrics.items_count or 0
+        self._scanned_count += self._metrics.scanned_count or 0
 
         # Log the query
         _log_operation(
@@ -153,8 +241,32 @@ class QueryResult:
             _log_warning("query", f"slow operation ({self._metrics.duration_ms:.1f}ms)")
 
         # If no last_key, this is the final page
-        if self._last_evaluated_key is None:
-            self._exhausted = True
+        self._exhausted = self._last_evaluated_key is None
+        if not self._exhausted and self._prefetch:
+            # Start the next request while the caller works on this page
+            self._prefetch_future = _get_prefetch_executor().submit(
+                self._query_page, self._last_evaluated_key
+            )
+
+    def _query_page(self, start_key: dict[str, Any] | None) -> Any:
+        """Run one query request. Safe to call from a background thread."""
+        # Acquire RCU before fetching, then settle up with what DynamoDB reports
+        acquire_rcu = self._acquire_rcu
+        if acquire_rcu is not None:
+            rcu_estimate = _estimate_rcu(self._limit, self._consistent_read)
+            acquire_rcu(rcu_estimate)
+
+        page = self._client.query_page(
+            self._table,
+            self._key_condition_expression,
+            exclusive_start_key=start_key,
+            **self._query_kwargs,
+        )
+        if acquire_rcu is not None:
+            extra_rcu = _extra_rcu(rcu_estimate, page[2])
+            if extra_rcu:
+                acquire_rcu(extra_rcu)
+        return page
 
 
 class AsyncQueryResult:
@@ -167,6 +279,24 @@ class AsyncQueryResult:
         ...     print(item["name"])
     """
 
+    __slots__ = (
+        "_client",
+        "_table",
+        "_key_condition_expression",
+        "_query_kwargs",
+        "_limit",
+        "_next_start_key",
+        "_acquire_rcu",
+        "_consistent_read",
+        "_current_page",
+        "_page_iter",
+        "_last_evaluated_key",
+        "_exhausted",
+        "_metrics",
+        "_count",
+        "_scanned_count",
+    )
+
     def __init__(
         self,
         client: pydynox_core.DynamoDBClient,
@@ -185,22 +315,29 @@ class AsyncQueryResult:
         self._client = client
         self._table = table
         self._key_condition_expression = key_condition_expression
-        self._filter_expression = filter_expression
-        self._expression_attribute_names = expression_attribute_names
-        self._expression_attribute_values = expression_attribute_values
+        # Built once, only the start key changes between pages
+        self._query_kwargs: dict[str, Any] = {
+            "filter_expression": filter_expression,
+            "expression_attribute_names": expression_attribute_names,
+            "expression_attribute_values": expression_attribute_values,
+            "limit": limit,
+            "scan_index_forward": scan_index_forward,
+            "index_name": index_name,
+            "consistent_read": consistent_read,
+        }
         self._limit = limit
-        self._scan_index_forward = scan_index_forward
-        self._index_name = index_name
-        self._start_key = last_evaluated_key
+        # Start key for the next request. None after the first request means done.
+        self._next_start_key = last_evaluated_key
         self._acquire_rcu = acquire_rcu
         self._consistent_read = consistent_read
 
         self._current_page: list[dict[str, Any]] = []
-        self._page_index = 0
+        self._page_iter: Iterator[dict[str, Any]] = iter(())
         self._last_evaluated_key: dict[str, Any] | None = None
         self._exhausted = False
-        self._first_fetch = True
         self._metrics: OperationMetrics | None = None
+        self._count = 0
+        self._scanned_count = 0
 
     @property
     def last_evaluated_key(self) -> dict[str, Any] | None:
@@ -212,64 +349,64 @@ class AsyncQueryResult:
         """Metrics from the last page fetch."""
         return self._metrics
 
+    @property
+    def count(self) -> int:
+        """Number of items returned by the pages fetched so far."""
+        return self._count
+
+    @property
+    def scanned_count(self) -> int:
+        """Number of items DynamoDB read for the pages fetched so far."""
+        return self._scanned_count
+
     def __aiter__(self) -> "AsyncQueryResult":
         return self
 
     async def __anext__(self) -> dict[str, Any]:
-        # If we have items in current page, return next one
-        if self._page_index < len(self._current_page):
-            item = self._current_page[self._page_index]
-            self._page_index += 1
-            return item
+        while True:
+            # If we have items in current page, return next one
+            item = next(self._page_iter, _SENTINEL)
+            if item is not _SENTINEL:
+                return item
 
-        # If exhausted, stop
-        if self._exhausted:
-            raise StopAsyncIteration
+            # If exhausted, stop
+            if self._exhausted:
+                raise StopAsyncIteration
 
-        # Fetch next page
-        await self._fetch_next_page()
-
-        # If no items after fetch, stop
-        if not self._current_page:
-            raise StopAsyncIteration
-
-        item = self._current_page[self._page_index]
-        self._page_index += 1
-        return item
+            # Fetch next page (can be empty when a filter removed every item)
+            await self._fetch_next_page()
 
     async def _fetch_next_page(self) -> None:
         """Fetch the next page of results from DynamoDB."""
-        # Don't fetch if we know there are no more pages
-        if not self._first_fetch and self._last_evaluated_key is None:
-            self._exhausted = True
-            return
-
-        # Use start_key on first fetch, then last_evaluated_key
-        start_key = self._start_key if self._first_fetch else self._last_evaluated_key
-        self._first_fetch = False
+        # Drop the finished page first, so it can be freed during the request
+        self._current_page = []
+        self._page_iter = iter(())
 
-        # Acquire RCU before fetching
-        if self._acquire_rcu is not None:
-            rcu_estimate = float(self._limit) if self._limit else 1.0
-            self._acquire_rcu(rcu_estimate)
+        # Acquire RCU before fetching, then settle up with what DynamoDB reports.
+        # The limiter may sleep, so it runs in a thread to keep the event loop free.
+        acquire_rcu = self._acquire_rcu
+        if acquire_rcu is not None:
+            rcu_estimate = _estimate_rcu(self._limit, self._consistent_read)
+            await asyncio.to_thread(acquire_rcu, rcu_estimate)
 
         result = await self._client.async_query_page(
             self._table,
             self._key_condition_expression,
-            filter_expression=self._filter_expression,
-            expression_attribute_names=self._expression_attribute_names,
-            expression_attribute_values=self._expression_attribute_values,
-            limit=self._limit,
-            exclusive_start_key=start_key,
-            scan_index_forward=self._scan_index_forward,
-            index_name=self._index_name,
-            consistent_read=self._consistent_read,
+            exclusive_start_key=self._next_start_key,
+            **self._query_kwargs,
         )
 
         self._current_page = result["items"]
+        self._page_iter = iter(self._current_page)
         self._last_evaluated_key = result["last_evaluated_key"]
+        self._next_start_key = self._last_evaluated_key
         self._metrics = result["metrics"]
-        self._page_index = 0
+        self._count += self._metrics.items_count or 0
+        self._scanned_count += self._metrics.scanned_count or 0
+        if acquire_rcu is not None:
+            extra_rcu = _extra_rcu(rcu_estimate, self._metrics)
+            if extra_rcu:
+                await asyncio.to_thread(acquire_rcu, extra_rcu)
 
         # Log the query
         _log_operation(
@@ -283,8 +420,23 @@ class AsyncQueryResult:
             _log_warning("query", f"slow operation ({self._metrics.duration_ms:.1f}ms)")
 
         # If no last_key, this is the final page
-        if self._last_evaluated_key is None:
-            self._exhausted = True
+        self._exhausted = self._last_evaluated_key is None
+
+    async def pages(self) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Iterate page by page instead of item by item.
+
+        Each page is the list of items from one request. Use it on a new
+        result, not one you already started iterating item by item.
+
+        Example:
+            >>> async for page in client.async_query("users", ...).pages():
+            ...     print(len(page))
+        """
+        while not self._exhausted:
+            await self._fetch_next_page()
+            page, self._current_page = self._current_page, []
+            self._page_iter = iter(())
+            yield page
 
     async def to_list(self) -> list[dict[str, Any]]:
         """Collect all results into a list.
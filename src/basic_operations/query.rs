@@ -173,7 +173,7 @@ pub async fn execute_query(
 
 /// Convert raw query result to Python types.
 fn raw_to_py_result(py: Python<'_>, raw: RawQueryResult) -> PyResult<QueryResult> {
-    let mut items = Vec::new();
+    let mut items = Vec::with_capacity(raw.items.len());
     for item in raw.items {
         let py_dict = attribute_values_to_py_dict(py, item)?;
         items.push(py_dict.into_any().unbind());
@@ -224,7 +224,9 @@ pub fn query(
         consistent_read,
     )?;
 
-    let result = runtime.block_on(execute_query(client.clone(), prepared));
+    // Release the GIL while waiting on the network, so other Python threads
+    // (like a page prefetch) can run.
+    let result = py.detach(|| runtime.block_on(execute_query(client.clone(), prepared)));
 
     match result {
         Ok(raw) => raw_to_py_result(py, raw),
@@ -270,7 +272,7 @@ pub fn async_query<'py>(
             Ok(raw) => {
                 let py_result = PyDict::new(py);
 
-                let mut items = Vec::new();
+                let mut items = Vec::with_capacity(raw.items.len());
                 for item in raw.items {
                     let py_dict = attribute_values_to_py_dict(py, item)?;
                     items.push(py_dict.into_any().unbind());
@@ -84,8 +84,21 @@ impl TokenBucket {
     /// Wait until tokens are available, then consume them.
     ///
     /// This is a blocking operation that sleeps until enough tokens
-    /// are available.
+    /// are available. The bucket never holds more than `max_tokens`, so a
+    /// bigger request is taken in parts of at most `max_tokens` each.
     pub fn acquire(&self, tokens: f64) {
+        let mut remaining = tokens;
+        if self.max_tokens > 0.0 {
+            while remaining > self.max_tokens {
+                self.acquire_within_burst(self.max_tokens);
+                remaining -= self.max_tokens;
+            }
+        }
+        self.acquire_within_burst(remaining);
+    }
+
+    /// Wait for and consume `tokens`, which must fit in the bucket.
+    fn acquire_within_burst(&self, tokens: f64) {
         loop {
             self.refill();
 
@@ -254,13 +267,19 @@ impl FixedRate {
     }
 
     /// Acquire read capacity (called from Python).
-    fn _acquire_rcu(&self, rcu: f64) {
-        self.acquire_rcu(rcu);
+    ///
+    /// Releases the GIL while waiting for tokens, so other Python threads
+    /// keep running.
+    fn _acquire_rcu(&self, py: Python<'_>, rcu: f64) {
+        py.detach(|| self.acquire_rcu(rcu));
     }
 
     /// Acquire write capacity (called from Python).
-    fn _acquire_wcu(&self, wcu: f64) {
-        self.acquire_wcu(wcu);
+    ///
+    /// Releases the GIL while waiting for tokens, so other Python threads
+    /// keep running.
+    fn _acquire_wcu(&self, py: Python<'_>, wcu: f64) {
+        py.detach(|| self.acquire_wcu(wcu));
     }
 
     /// Record a throttle event (called from Python).
@@ -401,13 +420,19 @@ impl AdaptiveRate {
     }
 
     /// Acquire read capacity (called from Python).
-    fn _acquire_rcu(&self, rcu: f64) {
-        self.acquire_rcu(rcu);
+    ///
+    /// Releases the GIL while waiting for tokens, so other Python threads
+    /// keep running.
+    fn _acquire_rcu(&self, py: Python<'_>, rcu: f64) {
+        py.detach(|| self.acquire_rcu(rcu));
     }
 
     /// Acquire write capacity (called from Python).
-    fn _acquire_wcu(&self, wcu: f64) {
-        self.acquire_wcu(wcu);
+    ///
+    /// Releases the GIL while waiting for tokens, so other Python threads
+    /// keep running.
+    fn _acquire_wcu(&self, py: Python<'_>, wcu: f64) {
+        py.detach(|| self.acquire_wcu(wcu));
     }
 
     /// Record a throttle event (called from Python).
@@ -5,9 +5,11 @@ Docker must be running to execute integration tests.
 """
 
 import time
+import uuid
 
 import pytest
 from pydynox import DynamoDBClient
+from pydynox.exceptions import TableNotFoundError
 from testcontainers.core.container import DockerContainer
 from testcontainers.core.waiting_utils import wait_for_logs
 
@@ -28,11 +30,24 @@ def dynamodb_container():
     # Wait for DynamoDB to be ready
     wait_for_logs(container, "Initializing DynamoDB Local", timeout=30)
 
-    # Give it a moment to fully initialize
-    time.sleep(0.5)
-
     host = container.get_container_host_ip()
     port = container.get_exposed_port(DYNAMODB_PORT)
+
+    # The log line can show up before requests are served, so ping
+    # (ListTables) until it answers instead of sleeping a fixed time
+    probe = DynamoDBClient(
+        region="us-east-1",
+        endpoint_url=f"http://{host}:{port}",
+        access_key="testing",
+        secret_key="testing",
+    )
+    deadline = time.monotonic() + 5.0
+    while not probe.ping():
+        if time.monotonic() > deadline:
+            container.stop()
+            raise RuntimeError("DynamoDB Local did not answer after start")
+        time.sleep(0.01)
+
     print(f"✅ DynamoDB Local ready at http://{host}:{port}")
 
     yield container
@@ -76,22 +91,35 @@ def _create_table(_session_client):
     return _session_client
 
 
-@pytest.fixture
-def table(_create_table, dynamodb_endpoint):
+@pytest.fixture(scope="session")
+def table(_create_table):
     """Provide a client with the test table ready.
 
+    One client for the whole session. Tests that need their own client
+    settings (like rate limits) should build their own client.
+
     Note: Tests should use unique keys to avoid conflicts.
     Use uuid or test-specific prefixes in pk/sk values.
     """
-    return DynamoDBClient(
-        region="us-east-1",
-        endpoint_url=dynamodb_endpoint,
-        access_key="testing",
-        secret_key="testing",
-    )
+    return _create_table
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dynamo(table):
     """Alias for table fixture - provides a pydynox DynamoDBClient."""
     return table
+
+
+@pytest.fixture
+def unique_table(request, _session_client):
+    """A table name only this test uses. The table is deleted after the test.
+
+    Tests that create tables use this so they don't depend on each other
+    and can run in parallel.
+    """
+    name = f"t_{request.node.originalname}_{uuid.uuid4().hex[:8]}"
+    yield name
+    try:
+        _session_client.delete_table(name)
+    except TableNotFoundError:
+        pass
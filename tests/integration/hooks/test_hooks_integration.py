@@ -6,8 +6,9 @@ from pydynox.attributes import StringAttribute
 from pydynox.hooks import after_delete, after_save, before_delete, before_save
 
 
-def test_hooks_run_on_save(dynamo):
-    """Test that hooks run when saving to real DynamoDB."""
+@pytest.fixture(scope="module")
+def user_model_cls(dynamo):
+    """User model with logging hooks, built once for the module."""
     call_log = []
 
     class User(Model):
@@ -24,77 +25,64 @@ def test_hooks_run_on_save(dynamo):
         def log_after_save(self):
             call_log.append(f"after_save:{self.pk}")
 
-    User._client_instance = None
+        @before_delete
+        def log_before_delete(self):
+            call_log.append(f"before_delete:{self.pk}")
 
-    user = User(pk="USER#1", sk="PROFILE", name="John")
-    user.save()
+        @after_delete
+        def log_after_delete(self):
+            call_log.append(f"after_delete:{self.pk}")
 
-    assert "before_save:USER#1" in call_log
-    assert "after_save:USER#1" in call_log
+    User.call_log = call_log
+    return User
 
-    # Verify item was saved
-    loaded = User.get(pk="USER#1", sk="PROFILE")
-    assert loaded is not None
-    assert loaded.name == "John"
 
+@pytest.fixture
+def user_model(user_model_cls):
+    """The shared User model with an empty call log."""
+    user_model_cls.call_log.clear()
+    return user_model_cls
 
-def test_hooks_run_on_delete(dynamo):
-    """Test that hooks run when deleting from real DynamoDB."""
-    call_log = []
 
-    class User(Model):
-        model_config = ModelConfig(table="test_table", client=dynamo)
-        pk = StringAttribute(hash_key=True)
-        sk = StringAttribute(range_key=True)
-        name = StringAttribute()
+def test_hooks_run_on_save(user_model):
+    """Test that hooks run when saving to real DynamoDB."""
+    user = user_model(pk="USER#1", sk="PROFILE", name="John")
+    user.save()
 
-        @before_delete
-        def log_before_delete(self):
-            call_log.append(f"before_delete:{self.pk}")
+    assert "before_save:USER#1" in user_model.call_log
+    assert "after_save:USER#1" in user_model.call_log
 
-        @after_delete
-        def log_after_delete(self):
-            call_log.append(f"after_delete:{self.pk}")
+    # Verify item was saved
+    loaded = user_model.get(pk="USER#1", sk="PROFILE")
+    assert loaded is not None
+    assert loaded.name == "John"
 
-    User._client_instance = None
 
-    user = User(pk="USER#2", sk="PROFILE", name="Jane")
+def test_hooks_run_on_delete(user_model):
+    """Test that hooks run when deleting from real DynamoDB."""
+    user = user_model(pk="USER#2", sk="PROFILE", name="Jane")
     user.save()
-    call_log.clear()
+    user_model.call_log.clear()
 
     user.delete()
 
-    assert "before_delete:USER#2" in call_log
-    assert "after_delete:USER#2" in call_log
+    assert "before_delete:USER#2" in user_model.call_log
+    assert "after_delete:USER#2" in user_model.call_log
 
     # Verify item was deleted
-    loaded = User.get(pk="USER#2", sk="PROFILE")
+    loaded = user_model.get(pk="USER#2", sk="PROFILE")
     assert loaded is None
 
 
-def test_skip_hooks_on_save(dynamo):
+def test_skip_hooks_on_save(user_model):
     """Test that skip_hooks=True skips hooks on real save."""
-    hook_called = []
-
-    class User(Model):
-        model_config = ModelConfig(table="test_table", client=dynamo)
-        pk = StringAttribute(hash_key=True)
-        sk = StringAttribute(range_key=True)
-        name = StringAttribute()
-
-        @before_save
-        def validate(self):
-            hook_called.append("called")
-
-    User._client_instance = None
-
-    user = User(pk="USER#3", sk="PROFILE", name="Bob")
+    user = user_model(pk="USER#3", sk="PROFILE", name="Bob")
     user.save(skip_hooks=True)
 
-    assert len(hook_called) == 0
+    assert len(user_model.call_log) == 0
 
     # But item should still be saved
-    loaded = User.get(pk="USER#3", sk="PROFILE")
+    loaded = user_model.get(pk="USER#3", sk="PROFILE")
     assert loaded is not None
     assert loaded.name == "Bob"
 
@@ -14,3 +14,32 @@ def reset_default_client():
     clear_default_client()
     yield
     clear_default_client()
+
+
+@pytest.fixture
+def run_script():
+    """Run Python code in a new process and fail the test if it hangs.
+
+    Used for tests that can block the whole interpreter (for example, Rust
+    code that holds the GIL), so a bug fails the test instead of the run.
+    """
+    import os
+    import subprocess
+    import sys
+
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    def run(script: str, timeout: float, message: str) -> None:
+        try:
+            proc = subprocess.run(
+                [sys.executable, "-c", script],
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            pytest.fail(message)
+        assert proc.returncode == 0, proc.stderr
+
+    return run
@@ -0,0 +1,56 @@
+"""Tests for DynamoDBClient."""
+
+from unittest.mock import patch
+
+import pytest
+from pydynox import DynamoDBClient, pydynox_core
+from pydynox.client import _shared_clients
+from pydynox.rate_limit import FixedRate
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_clients():
+    """Start each test without shared Rust clients."""
+    _shared_clients.clear()
+    yield
+    _shared_clients.clear()
+
+
+def test_clients_with_same_arguments_share_rust_client():
+    """Clients built with the same arguments share one Rust client (and pool)."""
+    with patch.object(pydynox_core, "DynamoDBClient") as core_client:
+        core_client.side_effect = lambda **kwargs: object()
+        client1 = DynamoDBClient(region="us-east-1", endpoint_url="http://localhost:8000")
+        client2 = DynamoDBClient(region="us-east-1", endpoint_url="http://localhost:8000")
+        client3 = DynamoDBClient(region="eu-west-1", endpoint_url="http://localhost:8000")
+
+    assert client1._client is client2._client
+    assert client1._client is not client3._client
+    assert core_client.call_count == 2
+
+
+def test_client_without_region_is_not_shared():
+    """Without an explicit region the region comes from the environment, so no sharing."""
+    with patch.object(pydynox_core, "DynamoDBClient") as core_client:
+        DynamoDBClient()
+        DynamoDBClient()
+
+    assert core_client.call_count == 2
+
+
+def test_query_acquire_rcu_is_none_without_rate_limit():
+    """Without a rate limiter, query results get no acquire callback."""
+    with patch.object(pydynox_core, "DynamoDBClient"):
+        client = DynamoDBClient(region="us-east-1")
+
+    assert client._query_acquire_rcu is None
+    assert client.query("users", "pk = :pk")._acquire_rcu is None
+
+
+def test_query_acquire_rcu_uses_rate_limiter_directly():
+    """With a rate limiter, query results call the limiter without the client wrapper."""
+    limiter = FixedRate(rcu=50)
+    with patch.object(pydynox_core, "DynamoDBClient"):
+        client = DynamoDBClient(region="us-east-1", rate_limit=limiter)
+
+    assert client._query_acquire_rcu == limiter._acquire_rcu
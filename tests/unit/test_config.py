@@ -187,6 +187,22 @@ def test_model_skip_hooks_from_config():
     assert user._should_skip_hooks(False) is False
 
 
+def test_model_skip_hooks_inherited_from_parent_config():
+    """Subclasses without their own model_config use the parent's skip_hooks."""
+    mock_client = MagicMock()
+
+    class Base(Model):
+        model_config = ModelConfig(table="users", client=mock_client, skip_hooks=True)
+        pk = StringAttribute(hash_key=True)
+
+    class Child(Base):
+        name = StringAttribute()
+
+    assert Base._skip_hooks_default is True
+    assert Child._skip_hooks_default is True
+    assert Model._skip_hooks_default is False
+
+
 def test_model_get_table_from_config():
     """Model gets table name from model_config."""
     mock_client = MagicMock()
@@ -196,3 +212,11 @@ def test_model_get_table_from_config():
         pk = StringAttribute(hash_key=True)
 
     assert User._get_table() == "my_users_table"
+
+
+def test_model_config_is_frozen():
+    """ModelConfig can't be changed after it is created."""
+    config = ModelConfig(table="users")
+
+    with pytest.raises(AttributeError):
+        config.table = "other"  # type: ignore[misc]
@@ -138,6 +138,24 @@ def test_save_puts_to_dynamodb():
     )
 
 
+def test_batch_save_sends_one_batch_write():
+    """batch_save() sends all items in one batch_write call."""
+    mock_client = MagicMock()
+
+    @dynamodb_model(table="users", hash_key="pk", client=mock_client)
+    @dataclass
+    class User:
+        pk: str
+        name: str
+
+    User.batch_save([User(pk="USER#1", name="John"), User(pk="USER#2", name="Jane")])
+
+    mock_client.batch_write.assert_called_once_with(
+        "users",
+        put_items=[{"pk": "USER#1", "name": "John"}, {"pk": "USER#2", "name": "Jane"}],
+    )
+
+
 def test_delete_removes_from_dynamodb():
     """delete() removes item from DynamoDB."""
     mock_client = MagicMock()
@@ -288,3 +306,18 @@ def test_update_invalid_attribute_raises_error():
 
     with pytest.raises(AttributeError, match="has no attribute 'invalid'"):
         user.update(invalid="value")
+
+
+def test_from_dataclass_returns_subclass():
+    """from_dataclass() returns a subclass and leaves the original class alone."""
+
+    @dataclass
+    class Product:
+        pk: str
+        name: str
+
+    ProductDB = from_dataclass(Product, table="products", hash_key="pk")
+
+    assert issubclass(ProductDB, Product)
+    assert not hasattr(Product, "save")
+    assert repr(ProductDB(pk="PROD#1", name="Pen")).endswith("Product(pk='PROD#1', name='Pen')")
@@ -64,7 +64,7 @@ def test_all_hook_decorators(decorator, expected_type):
 
 
 def test_model_collects_hooks(mock_client):
-    """Test that Model metaclass collects hooks."""
+    """Test that Model collects hooks."""
 
     class User(Model):
         model_config = ModelConfig(table="users", client=mock_client)
@@ -293,3 +293,52 @@ def test_multiple_hooks_run_in_order(mock_client):
     user.save()
 
     assert call_order == ["first", "second"]
+
+
+def test_batch_save_runs_hooks_around_the_batch(mock_client):
+    """Test that batch_save runs before_save hooks before the write and after_save after."""
+    call_order = []
+    mock_client.batch_write.side_effect = lambda *args, **kwargs: call_order.append("write")
+
+    class User(Model):
+        model_config = ModelConfig(table="users", client=mock_client)
+        pk = StringAttribute(hash_key=True)
+
+        @before_save
+        def before(self):
+            call_order.append(f"before:{self.pk}")
+
+        @after_save
+        def after(self):
+            call_order.append(f"after:{self.pk}")
+
+    User._client_instance = None
+
+    User.batch_save([User(pk="USER#1"), User(pk="USER#2")])
+
+    assert call_order == ["before:USER#1", "before:USER#2", "write", "after:USER#1", "after:USER#2"]
+
+
+def test_model_builds_hook_runners(mock_client):
+    """Each hook type gets a _fire_<hook> method that runs the hooks in order."""
+    calls = []
+
+    class User(Model):
+        model_config = ModelConfig(table="users", client=mock_client)
+        pk = StringAttribute(hash_key=True)
+
+        @before_save
+        def first(self):
+            calls.append("first")
+
+        @before_save
+        def second(self):
+            calls.append("second")
+
+    user = User(pk="USER#1")
+    user._fire_before_save()
+    user._fire_after_load()  # no hooks, does nothing
+
+    assert calls == ["first", "second"]
+    assert User._has_before_save is True
+    assert User._has_after_load is False
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 from pydynox import GlobalSecondaryIndex, Model, ModelConfig
@@ -110,6 +111,18 @@ def test_gsi_to_dynamodb_definition_keys_only() -> None:
     assert definition["Projection"] == {"ProjectionType": "KEYS_ONLY"}
 
 
+def test_gsi_to_dynamodb_definition_returns_new_dict() -> None:
+    """Changing a returned definition doesn't affect later calls."""
+    definition = User.custom_projection_index.to_dynamodb_definition()
+    definition["ProvisionedThroughput"] = {"ReadCapacityUnits": 5}
+    definition["Projection"]["NonKeyAttributes"].append("extra")
+
+    fresh = User.custom_projection_index.to_dynamodb_definition()
+
+    assert "ProvisionedThroughput" not in fresh
+    assert "extra" not in fresh["Projection"]["NonKeyAttributes"]
+
+
 def test_gsi_query_requires_hash_key() -> None:
     """Test GSI query raises error if hash key not provided."""
     with pytest.raises(ValueError, match="requires 'email'"):
@@ -136,3 +149,45 @@ def test_gsi_inheritance() -> None:
     assert "email_index" in AdminUser._indexes
     assert "status_index" in AdminUser._indexes
     assert AdminUser.email_index._model_class is AdminUser
+
+
+def test_gsi_collection_is_built_once_and_read_only() -> None:
+    """_indexes is built when the class is created and can't be changed."""
+
+    class AdminUser(User):
+        role = StringAttribute()
+
+    assert AdminUser._indexes is AdminUser._indexes
+    assert AdminUser._indexes is not User._indexes
+    with pytest.raises(TypeError):
+        AdminUser._indexes["other"] = User.email_index  # type: ignore[index]
+
+
+def test_operations_never_describe_the_table() -> None:
+    """Keys and indexes come from the model, so no call asks DynamoDB for the schema."""
+    client = MagicMock()
+    for name in ("table_exists", "wait_for_table_active", "create_table"):
+        getattr(client, name).side_effect = AssertionError(f"{name} should not be called")
+    client.get_item.return_value = {"pk": "USER#1", "sk": "PROFILE", "email": "a@b.c"}
+    client._client.query_page.return_value = (
+        [{"pk": "USER#1", "sk": "PROFILE", "email": "a@b.c"}],
+        None,
+        MagicMock(duration_ms=1.0, consumed_rcu=0.5, items_count=1, scanned_count=1),
+    )
+
+    class Account(Model):
+        model_config = ModelConfig(table="accounts", client=client)
+        pk = StringAttribute(hash_key=True)
+        sk = StringAttribute(range_key=True)
+        email = StringAttribute()
+
+        email_index = GlobalSecondaryIndex(index_name="email-index", hash_key="email")
+
+    account = Account.get(pk="USER#1", sk="PROFILE")
+    assert account is not None
+    account.save()
+    account.update(email="x@y.z")
+    account.delete()
+    assert len(list(Account.query(hash_key="USER#1"))) == 1
+    assert len(list(Account.email_index.query(email="a@b.c"))) == 1
+    assert not [call for call in client.mock_calls if "describe" in call[0]]
@@ -1,10 +1,16 @@
 """Tests for Model base class."""
 
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
 from pydynox import Model, ModelConfig, clear_default_client, set_default_client
-from pydynox.attributes import NumberAttribute, StringAttribute
+from pydynox.attributes import (
+    DatetimeAttribute,
+    NumberAttribute,
+    StringAttribute,
+    VersionAttribute,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -37,7 +43,7 @@ def user_model(mock_client):
 
 
 def test_model_collects_attributes(user_model):
-    """Model metaclass collects all attributes."""
+    """Model collects all attributes."""
     assert "pk" in user_model._attributes
     assert "sk" in user_model._attributes
     assert "name" in user_model._attributes
@@ -45,7 +51,7 @@ def test_model_collects_attributes(user_model):
 
 
 def test_model_identifies_keys(user_model):
-    """Model metaclass identifies hash and range keys."""
+    """Model identifies hash and range keys."""
     assert user_model._hash_key == "pk"
     assert user_model._range_key == "sk"
 
@@ -130,6 +136,33 @@ def test_model_equality(user_model):
     assert user1 != user3  # Different key
 
 
+def test_model_hash_uses_key(user_model):
+    """Instances with the same key have the same hash and dedupe in sets."""
+    user1 = user_model(pk="USER#1", sk="PROFILE", name="John")
+    user2 = user_model(pk="USER#1", sk="PROFILE", name="Jane")
+    user3 = user_model(pk="USER#2", sk="PROFILE", name="John")
+
+    assert user_model._key_attrs == ("pk", "sk")
+    assert hash(user1) == hash(user2)
+    assert len({user1, user2, user3}) == 2
+
+
+def test_model_equality_with_hash_key_only(mock_client):
+    """Models with only a hash key compare and hash by that one value."""
+
+    class Session(Model):
+        model_config = ModelConfig(table="sessions", client=mock_client)
+        pk = StringAttribute(hash_key=True)
+        data = StringAttribute()
+
+    session1 = Session(pk="S#1", data="a")
+    session2 = Session(pk="S#1", data="b")
+
+    assert session1 == session2
+    assert session1 != Session(pk="S#2")
+    assert len({session1, session2}) == 1
+
+
 def test_model_get(user_model, mock_client):
     """Model.get fetches item from DynamoDB."""
     mock_client.get_item.return_value = {
@@ -216,3 +249,313 @@ def test_model_with_default_client(mock_client):
     assert user is not None
     assert user.name == "John"
     mock_client.get_item.assert_called_once()
+
+
+def test_model_batch_save(user_model, mock_client):
+    """Model.batch_save sends all items in one batch_write call."""
+    users = [user_model(pk=f"USER#{i}", sk="PROFILE", name=f"User {i}") for i in range(30)]
+
+    user_model.batch_save(users)
+
+    mock_client.batch_write.assert_called_once_with(
+        "users", put_items=[user.to_dict() for user in users]
+    )
+
+
+def test_model_batch_save_empty(user_model, mock_client):
+    """Model.batch_save does nothing for an empty list."""
+    user_model.batch_save([])
+
+    mock_client.batch_write.assert_not_called()
+
+
+def test_model_batch_delete(user_model, mock_client):
+    """Model.batch_delete sends the keys of all items."""
+    users = [user_model(pk=f"USER#{i}", sk="PROFILE") for i in range(3)]
+
+    user_model.batch_delete(users)
+
+    mock_client.batch_write.assert_called_once_with(
+        "users",
+        delete_keys=[
+            {"pk": "USER#0", "sk": "PROFILE"},
+            {"pk": "USER#1", "sk": "PROFILE"},
+            {"pk": "USER#2", "sk": "PROFILE"},
+        ],
+    )
+
+
+def test_model_batch_get(user_model, mock_client):
+    """Model.batch_get returns model instances."""
+    mock_client.batch_get.return_value = [
+        {"pk": "USER#1", "sk": "PROFILE", "name": "John"},
+        {"pk": "USER#2", "sk": "PROFILE", "name": "Jane"},
+    ]
+    keys = [{"pk": "USER#1", "sk": "PROFILE"}, {"pk": "USER#2", "sk": "PROFILE"}]
+
+    users = user_model.batch_get(keys)
+
+    assert [user.name for user in users] == ["John", "Jane"]
+    assert all(isinstance(user, user_model) for user in users)
+    mock_client.batch_get.assert_called_once_with("users", keys)
+
+
+def test_model_get_many_keeps_key_order(user_model, mock_client):
+    """Model.get_many lines results up with keys, with None for missing items."""
+    mock_client.batch_get.return_value = [
+        {"pk": "USER#3", "sk": "PROFILE", "name": "Bob"},
+        {"pk": "USER#1", "sk": "PROFILE", "name": "John"},
+    ]
+    keys = [
+        {"pk": "USER#1", "sk": "PROFILE"},
+        {"pk": "USER#2", "sk": "PROFILE"},
+        {"pk": "USER#3", "sk": "PROFILE"},
+    ]
+
+    users = user_model.get_many(keys)
+
+    assert [user.name if user else None for user in users] == ["John", None, "Bob"]
+    mock_client.batch_get.assert_called_once_with("users", keys)
+
+
+def test_model_get_many_matches_non_string_keys(mock_client):
+    """get_many matches keys whose Python value differs from the stored one."""
+
+    class Event(Model):
+        model_config = ModelConfig(table="events", client=mock_client)
+        pk = NumberAttribute(hash_key=True)
+        at = DatetimeAttribute(range_key=True)
+
+    mock_client.batch_get.return_value = [{"pk": 7, "at": "2024-01-15T10:30:00+00:00"}]
+    keys = [
+        {"pk": 7, "at": "2024-01-15T10:30:00+00:00"},
+        {"pk": 7, "at": "2024-01-16T10:30:00+00:00"},
+    ]
+
+    events = Event.get_many(keys)
+
+    assert events[0] is not None
+    assert events[0].at == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+    assert events[1] is None
+
+
+def test_model_batch_save_rejects_version_attribute(mock_client):
+    """Model.batch_save can't do optimistic locking, so it raises."""
+
+    class Doc(Model):
+        model_config = ModelConfig(table="docs", client=mock_client)
+        pk = StringAttribute(hash_key=True)
+        version = VersionAttribute()
+
+    Doc._client_instance = None
+
+    with pytest.raises(ValueError, match="VersionAttribute"):
+        Doc.batch_save([Doc(pk="DOC#1")])
+
+    mock_client.batch_write.assert_not_called()
+
+
+def test_model_generates_get_key_and_to_dict(user_model):
+    """Each model class gets its own _get_key and to_dict."""
+    assert user_model._get_key is not Model._get_key
+    assert user_model.to_dict is not Model.to_dict
+
+    user = user_model(pk="USER#1", sk="PROFILE", name="John")
+    assert user._get_key() == {"pk": "USER#1", "sk": "PROFILE"}
+    assert user.to_dict() == {"pk": "USER#1", "sk": "PROFILE", "name": "John"}
+
+
+def test_model_generates_init(mock_client):
+    """Each model class gets its own __init__ with the same rules as Model.__init__."""
+
+    class User(Model):
+        model_config = ModelConfig(table="users", client=mock_client)
+        pk = StringAttribute(hash_key=True)
+        status = StringAttribute(default="active")
+        name = StringAttribute(null=False)
+
+    assert User.__init__ is not Model.__init__
+
+    user = User(pk="USER#1", name="John", extra=1)
+    assert vars(user) == {"pk": "USER#1", "status": "active", "name": "John"}
+    with pytest.raises(ValueError, match="Attribute 'name' is required"):
+        User(pk="USER#1")
+    with pytest.raises(TypeError):
+        User("USER#1")
+
+
+def test_model_generated_methods_work_through_super(mock_client):
+    """Custom methods in a subclass can call the parent's generated ones with super()."""
+
+    class Base(Model):
+        model_config = ModelConfig(table="users", client=mock_client)
+        pk = StringAttribute(hash_key=True)
+
+    class User(Base):
+        name = StringAttribute()
+
+        def to_dict(self):
+            data = super().to_dict()
+            data["kind"] = "user"
+            return data
+
+        @classmethod
+        def from_dict(cls, data):
+            return super().from_dict({**data, "name": data["name"].title()})
+
+    user = User.from_dict({"pk": "USER#1", "name": "john"})
+
+    assert user.name == "John"
+    assert user.to_dict() == {"pk": "USER#1", "name": "John", "kind": "user"}
+
+
+def test_model_attributes_named_like_builtins(mock_client):
+    """Attributes can use builtin names such as type, id and len."""
+
+    class Event(Model):
+        model_config = ModelConfig(table="events", client=mock_client)
+        pk = StringAttribute(hash_key=True)
+        type = StringAttribute(null=False)
+        id = StringAttribute()
+        len = NumberAttribute()
+
+    event = Event(pk="E#1", type="click", len=3)
+
+    assert (event.type, event.id, event.len) == ("click", None, 3)
+    assert event.to_dict() == {"pk": "E#1", "type": "click", "len": 3}
+    assert Event.from_dict({"pk": "E#1", "type": "view"}).type == "view"
+    with pytest.raises(ValueError, match="Attribute 'type' is required"):
+        Event(pk="E#1")
+
+
+def test_model_keeps_user_defined_to_dict(mock_client):
+    """A to_dict written by the user is kept, also in subclasses."""
+
+    class Base(Model):
+        model_config = ModelConfig(table="users", client=mock_client)
+        pk = StringAttribute(hash_key=True)
+
+        def to_dict(self):
+            return {"custom": True}
+
+    class Child(Base):
+        name = StringAttribute()
+
+    assert Child(pk="USER#1", name="John").to_dict() == {"custom": True}
+    assert Child(pk="USER#1")._get_key() == {"pk": "USER#1"}
+
+
+def test_model_collects_attributes_through_levels_and_mixins(mock_client):
+    """Attributes and keys come from every model base, mixins are ignored."""
+
+    class TimestampMixin:
+        def touch(self):
+            return "touched"
+
+    class Base(Model):
+        model_config = ModelConfig(table="users", client=mock_client)
+        pk = StringAttribute(hash_key=True)
+
+    class Middle(Base):
+        sk = StringAttribute(range_key=True)
+
+    class Leaf(Middle, TimestampMixin):
+        name = StringAttribute()
+
+    assert list(Leaf._attributes) == ["pk", "sk", "name"]
+    assert Leaf._key_attrs == ("pk", "sk")
+    assert Leaf(pk="A", sk="B").touch() == "touched"
+
+
+def test_model_generic_to_dict_matches_generated(user_model):
+    """The root Model.to_dict gives the same result as the generated one."""
+    user = user_model(pk="USER#1", sk="PROFILE", name="John")
+
+    assert Model.to_dict(user) == user.to_dict()
+
+
+def test_model_to_dict_skips_unset_attribute(user_model):
+    """An attribute missing from the instance is left out, not read from the class."""
+    user = user_model(pk="USER#1", sk="PROFILE", name="John")
+    del user.__dict__["name"]
+
+    assert user.to_dict() == {"pk": "USER#1", "sk": "PROFILE"}
+    assert Model.to_dict(user) == user.to_dict()
+
+
+def test_model_execute_statement_returns_models(user_model, mock_client):
+    """execute_statement turns each row into a model instance."""
+    mock_client.execute_statement.return_value = [
+        {"pk": "USER#1", "sk": "PROFILE", "name": "John", "age": 30},
+        {"pk": "USER#2", "sk": "PROFILE", "name": "Jane"},
+    ]
+
+    users = user_model.execute_statement("SELECT * FROM users")
+
+    assert [u.name for u in users] == ["John", "Jane"]
+    assert users[0].age == 30
+    assert users[1].age is None
+
+
+def test_model_batch_uses_custom_from_dict(mock_client):
+    """A from_dict written by the user is used for batch results."""
+
+    class User(Model):
+        model_config = ModelConfig(table="users", client=mock_client)
+        pk = StringAttribute(hash_key=True)
+        name = StringAttribute()
+
+        @classmethod
+        def from_dict(cls, data):
+            return cls(pk=data["pk"], name=data["name"].title())
+
+    mock_client.batch_get.return_value = [{"pk": "USER#1", "name": "john"}]
+
+    users = User.batch_get([{"pk": "USER#1"}])
+
+    assert users[0].name == "John"
+
+
+def test_model_uses_plain_type_as_metaclass(user_model):
+    """Models don't need a custom metaclass."""
+    assert type(Model) is type
+    assert type(user_model) is type
+    assert Model._attributes == {}
+    assert Model._key_attrs == ()
+
+
+def test_model_from_dict_defaults_and_required(mock_client):
+    """from_dict fills defaults, ignores unknown keys and checks required fields."""
+
+    class User(Model):
+        model_config = ModelConfig(table="users", client=mock_client)
+        pk = StringAttribute(hash_key=True)
+        status = StringAttribute(default="active")
+        name = StringAttribute(null=False)
+
+    user = User.from_dict({"pk": "USER#1", "name": "John", "extra": 1})
+
+    assert user.status == "active"
+    assert "extra" not in vars(user)
+    with pytest.raises(ValueError, match="Attribute 'name' is required"):
+        User.from_dict({"pk": "USER#1"})
+
+
+def test_model_from_dict_uses_custom_init(mock_client):
+    """from_dict goes through __init__ when the model defines its own."""
+
+    class Base(Model):
+        model_config = ModelConfig(table="users", client=mock_client)
+        pk = StringAttribute(hash_key=True)
+
+    class User(Base):
+        name = StringAttribute()
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.loaded = True
+
+    user = User.from_dict({"pk": "USER#1", "name": "John"})
+
+    assert user.loaded is True
+    assert user.name == "John"
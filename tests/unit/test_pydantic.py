@@ -3,8 +3,15 @@
 from unittest.mock import MagicMock
 
 import pytest
-from pydantic import BaseModel, Field
-from pydynox.integrations.pydantic import dynamodb_model, from_pydantic
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+from pydynox import clear_default_client, set_default_client
+from pydynox.integrations.pydantic import DynamoDBModel, dynamodb_model, from_pydantic
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock DynamoDB client."""
+    return MagicMock()
 
 
 def test_decorator_adds_metadata():
@@ -19,6 +26,7 @@ def test_decorator_adds_metadata():
     assert User._pydynox_table == "users"
     assert User._pydynox_hash_key == "pk"
     assert User._pydynox_range_key == "sk"
+    assert User._pydynox_key_names == ("pk", "sk")
 
 
 def test_decorator_adds_methods():
@@ -88,9 +96,8 @@ def test_get_key_returns_hash_and_range():
     assert key == {"pk": "USER#1", "sk": "PROFILE"}
 
 
-def test_get_fetches_from_dynamodb():
+def test_get_fetches_from_dynamodb(mock_client):
     """get() fetches item from DynamoDB and returns Pydantic model."""
-    mock_client = MagicMock()
     mock_client.get_item.return_value = {
         "pk": "USER#1",
         "sk": "PROFILE",
@@ -114,9 +121,8 @@ def test_get_fetches_from_dynamodb():
     mock_client.get_item.assert_called_once_with("users", {"pk": "USER#1", "sk": "PROFILE"})
 
 
-def test_get_returns_none_when_not_found():
+def test_get_returns_none_when_not_found(mock_client):
     """get() returns None when item not found."""
-    mock_client = MagicMock()
     mock_client.get_item.return_value = None
 
     @dynamodb_model(table="users", hash_key="pk", range_key="sk", client=mock_client)
@@ -130,9 +136,8 @@ def test_get_returns_none_when_not_found():
     assert user is None
 
 
-def test_save_puts_to_dynamodb():
+def test_save_puts_to_dynamodb(mock_client):
     """save() puts item to DynamoDB."""
-    mock_client = MagicMock()
 
     @dynamodb_model(table="users", hash_key="pk", range_key="sk", client=mock_client)
     class User(BaseModel):
@@ -149,9 +154,43 @@ def test_save_puts_to_dynamodb():
     )
 
 
-def test_delete_removes_from_dynamodb():
+def test_batch_save_sends_one_batch_write(mock_client):
+    """batch_save() sends all items in one batch_write call (chunked by the client)."""
+
+    @dynamodb_model(table="users", hash_key="pk", client=mock_client)
+    class User(BaseModel):
+        pk: str
+        name: str
+
+    users = [User(pk=f"USER#{i}", name=f"User {i}") for i in range(30)]
+    User.batch_save(users)
+
+    mock_client.put_item.assert_not_called()
+    mock_client.batch_write.assert_called_once()
+    args, kwargs = mock_client.batch_write.call_args
+    assert args == ("users",)
+    assert len(kwargs["put_items"]) == 30
+    assert kwargs["put_items"][0] == {"pk": "USER#0", "name": "User 0"}
+
+
+def test_batch_delete_sends_keys(mock_client):
+    """batch_delete() sends the key of each item."""
+
+    @dynamodb_model(table="users", hash_key="pk", range_key="sk", client=mock_client)
+    class User(BaseModel):
+        pk: str
+        sk: str
+
+    User.batch_delete([User(pk="USER#1", sk="A"), User(pk="USER#2", sk="B")])
+
+    mock_client.batch_write.assert_called_once_with(
+        "users",
+        delete_keys=[{"pk": "USER#1", "sk": "A"}, {"pk": "USER#2", "sk": "B"}],
+    )
+
+
+def test_delete_removes_from_dynamodb(mock_client):
     """delete() removes item from DynamoDB."""
-    mock_client = MagicMock()
 
     @dynamodb_model(table="users", hash_key="pk", range_key="sk", client=mock_client)
     class User(BaseModel):
@@ -165,9 +204,8 @@ def test_delete_removes_from_dynamodb():
     mock_client.delete_item.assert_called_once_with("users", {"pk": "USER#1", "sk": "PROFILE"})
 
 
-def test_update_updates_dynamodb():
+def test_update_updates_dynamodb(mock_client):
     """update() updates item in DynamoDB."""
-    mock_client = MagicMock()
 
     @dynamodb_model(table="users", hash_key="pk", range_key="sk", client=mock_client)
     class User(BaseModel):
@@ -244,7 +282,7 @@ def test_pydantic_field_validation():
         ValidatedModel(id="1", age=200)
 
 
-def test_set_client_after_creation():
+def test_set_client_after_creation(mock_client):
     """_set_client() allows setting client after model creation."""
 
     @dynamodb_model(table="users", hash_key="pk")
@@ -252,7 +290,6 @@ def test_set_client_after_creation():
         pk: str
         name: str
 
-    mock_client = MagicMock()
     mock_client.get_item.return_value = {"pk": "USER#1", "name": "John"}
 
     User._set_client(mock_client)
@@ -274,3 +311,186 @@ def test_no_client_raises_error():
 
     with pytest.raises(RuntimeError, match="No client set"):
         user.save()
+
+
+def test_uses_and_caches_default_client(mock_client):
+    """Without client=, the default client is used and cached on the class."""
+    mock_client.get_item.return_value = {"pk": "USER#1", "name": "John"}
+
+    @dynamodb_model(table="users", hash_key="pk")
+    class User(BaseModel):
+        pk: str
+        name: str
+
+    set_default_client(mock_client)
+    try:
+        user = User.get(pk="USER#1")
+    finally:
+        clear_default_client()
+
+    assert user.name == "John"
+    assert User._pydynox_client is mock_client
+    assert User._get_client() is mock_client
+
+
+def test_from_pydantic_returns_subclass():
+    """from_pydantic() returns a subclass and leaves the original class alone."""
+
+    class Product(BaseModel):
+        pk: str
+        name: str
+
+    ProductDB = from_pydantic(Product, table="products", hash_key="pk")
+
+    assert issubclass(ProductDB, Product)
+    assert ProductDB.__name__ == "Product"
+    assert not hasattr(Product, "save")
+
+    item = ProductDB(pk="PROD#1", name="Pen")
+    assert isinstance(item, Product)
+    assert item.model_dump() == {"pk": "PROD#1", "name": "Pen"}
+
+
+def test_from_pydantic_calls_do_not_share_client():
+    """Each from_pydantic() call gets its own class, so clients don't leak between them."""
+
+    class Product(BaseModel):
+        pk: str
+
+    first = from_pydantic(Product, table="products", hash_key="pk")
+    second = from_pydantic(Product, table="products", hash_key="pk")
+    first._set_client(MagicMock())
+
+    assert first is not second
+    assert second._pydynox_client is None
+
+
+def test_update_validates_only_changed_fields(mock_client):
+    """update() validates the new values with the field rules."""
+
+    @dynamodb_model(table="users", hash_key="pk", client=mock_client)
+    class User(BaseModel):
+        pk: str
+        age: int = Field(default=0, ge=0)
+
+    user = User(pk="USER#1")
+    user.update(age="31")
+
+    assert user.age == 31
+    mock_client.update_item.assert_called_once_with("users", {"pk": "USER#1"}, updates={"age": 31})
+    with pytest.raises(ValidationError):
+        user.update(age=-1)
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        user.update(missing=1)
+
+
+def test_update_uses_model_config(mock_client):
+    """update() applies model_config rules like str_strip_whitespace and str_to_lower."""
+
+    class Tag(BaseModel):
+        label: str
+
+    @dynamodb_model(table="users", hash_key="pk", client=mock_client)
+    class User(BaseModel):
+        model_config = ConfigDict(str_strip_whitespace=True, str_to_lower=True, str_max_length=8)
+
+        pk: str
+        name: str = ""
+        tag: Tag | None = None
+        main_tag: Tag = Tag(label="x")
+
+    user = User(pk="user#1", name="  HELLO ")
+    user.update(name="  WORLD  ")
+
+    assert user.name == "world"
+    mock_client.update_item.assert_called_once_with(
+        "users", {"pk": "user#1"}, updates={"name": "world"}
+    )
+    with pytest.raises(ValidationError):
+        user.update(name="much too long")
+
+    # A model-typed field can't take config=, so it goes through model_validate
+    user.update(main_tag={"label": "y"})
+    assert user.main_tag == Tag(label="y")
+
+
+def test_update_runs_field_validators(mock_client):
+    """update() still runs field validators."""
+
+    @dynamodb_model(table="users", hash_key="pk", client=mock_client)
+    class User(BaseModel):
+        pk: str
+        name: str = ""
+
+        @field_validator("name")
+        @classmethod
+        def upper(cls, value: str) -> str:
+            return value.upper()
+
+    user = User(pk="USER#1")
+    user.update(name="jane")
+
+    assert user.name == "JANE"
+
+
+def test_base_class_adds_metadata():
+    """DynamoDBModel takes the table settings as class keywords."""
+
+    class User(DynamoDBModel, table="users", hash_key="pk", range_key="sk"):
+        pk: str
+        sk: str
+        name: str
+
+    assert User._pydynox_table == "users"
+    assert User._pydynox_hash_key == "pk"
+    assert User._pydynox_range_key == "sk"
+    assert User._pydynox_key_names == ("pk", "sk")
+    assert list(User.model_fields) == ["pk", "sk", "name"]
+
+
+def test_base_class_crud_and_inheritance(mock_client):
+    """Subclasses of a DynamoDBModel keep the table and validate their own fields."""
+
+    class User(DynamoDBModel, table="users", hash_key="pk", client=mock_client):
+        pk: str
+        name: str
+
+    class Admin(User):
+        level: int = 0
+
+    admin = Admin(pk="USER#1", name="John")
+    admin.save()
+    admin.update(level="2")
+
+    mock_client.put_item.assert_called_once_with(
+        "users", {"pk": "USER#1", "name": "John", "level": 0}
+    )
+    mock_client.update_item.assert_called_once_with("users", {"pk": "USER#1"}, updates={"level": 2})
+    assert admin.level == 2
+
+
+def test_base_class_requires_hash_key():
+    """table= without hash_key= raises TypeError."""
+    with pytest.raises(TypeError, match="needs hash_key="):
+
+        class User(DynamoDBModel, table="users"):
+            pk: str
+
+
+def test_star_import_without_pydantic():
+    """Without pydantic, the module loads and star-import skips DynamoDBModel."""
+    import importlib
+    import sys
+    from unittest.mock import patch
+
+    import pydynox.integrations.pydantic as module
+
+    try:
+        with patch.dict(sys.modules, {"pydantic": None}):
+            importlib.reload(module)
+            namespace: dict = {}
+            exec("from pydynox.integrations.pydantic import *", namespace)
+            assert "DynamoDBModel" not in module.__all__
+            assert "from_pydantic" in namespace
+    finally:
+        importlib.reload(module)
@@ -196,3 +196,289 @@ def test_query_raises_error_without_hash_key(mock_client):
 
     with pytest.raises(ValueError, match="has no hash key defined"):
         result.first()
+
+
+def test_sync_and_async_build_the_same_query(user_model, mock_client):
+    """Sync and async model queries pass the same arguments to the query result."""
+    condition = user_model.sk.begins_with("ORDER#")
+
+    sync_query = user_model.query(hash_key="USER#1", range_key_condition=condition)._build_query()
+    async_query = user_model.async_query(
+        hash_key="USER#1", range_key_condition=condition
+    )._build_query()
+
+    for query in (sync_query, async_query):
+        assert query._table == "users"
+        assert query._key_condition_expression.startswith("#pk = :pkv AND ")
+        assert query._query_kwargs["expression_attribute_names"]["#pk"] == "pk"
+        assert query._query_kwargs["expression_attribute_values"][":pkv"] == "USER#1"
+        assert query._acquire_rcu is mock_client._query_acquire_rcu
+
+
+def _page(items, last_key, consumed_rcu=0.5, scanned_count=None):
+    metrics = MagicMock(
+        duration_ms=1.0,
+        consumed_rcu=consumed_rcu,
+        items_count=len(items),
+        scanned_count=len(items) if scanned_count is None else scanned_count,
+    )
+    return items, last_key, metrics
+
+
+def test_query_result_prefetch_returns_all_pages_in_order():
+    """With prefetch, pages come back in order and the last key is tracked."""
+    from pydynox.query import QueryResult
+
+    core = MagicMock()
+    core.query_page.side_effect = [
+        _page([{"pk": "A", "sk": "1"}], {"pk": "A", "sk": "1"}),
+        _page([{"pk": "A", "sk": "2"}], {"pk": "A", "sk": "2"}),
+        _page([{"pk": "A", "sk": "3"}], None),
+    ]
+
+    result = QueryResult(core, "users", "#pk = :pk", limit=1, prefetch=True)
+
+    assert [item["sk"] for item in result] == ["1", "2", "3"]
+    assert result.last_evaluated_key is None
+    assert core.query_page.call_count == 3
+    start_keys = [call.kwargs["exclusive_start_key"] for call in core.query_page.call_args_list]
+    assert start_keys == [None, {"pk": "A", "sk": "1"}, {"pk": "A", "sk": "2"}]
+    assert all(call.kwargs["limit"] == 1 for call in core.query_page.call_args_list)
+
+
+# Runs in a child process: if the Rust query holds the GIL while it waits on
+# the network, the fake server thread can never answer and the process hangs.
+_PREFETCH_OVERLAP_SCRIPT = """
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pydynox import DynamoDBClient
+
+second_page_requested = threading.Event()
+release_second_page = threading.Event()
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if "ExclusiveStartKey" not in request:
+            page = {"Items": [{"pk": {"S": "a"}}], "LastEvaluatedKey": {"pk": {"S": "a"}}}
+        else:
+            second_page_requested.set()
+            release_second_page.wait(10)
+            page = {"Items": [{"pk": {"S": "b"}}]}
+        body = json.dumps({**page, "Count": 1, "ScannedCount": 1}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-amz-json-1.0")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+client = DynamoDBClient(
+    region="us-east-1",
+    endpoint_url=f"http://127.0.0.1:{server.server_address[1]}",
+    access_key="testing",
+    secret_key="testing",
+)
+result = client.query(
+    "users",
+    "#pk = :pk",
+    expression_attribute_names={"#pk": "pk"},
+    expression_attribute_values={":pk": "a"},
+    prefetch=True,
+)
+items = iter(result)
+first = next(items)
+# The caller still holds page 1 while page 2 is requested in the background
+assert second_page_requested.wait(10), "second page was not requested during the first"
+release_second_page.set()
+assert [first, *items] == [{"pk": "a"}, {"pk": "b"}]
+"""
+
+
+def test_query_prefetch_fetches_next_page_concurrently(run_script):
+    """With prefetch, page 2 is requested while the caller is still on page 1.
+
+    Uses the real client against a local fake DynamoDB endpoint, so it also
+    checks that the sync query releases the GIL while it waits.
+    """
+    run_script(
+        _PREFETCH_OVERLAP_SCRIPT,
+        timeout=30,
+        message="query blocked other threads while waiting on the network",
+    )
+
+
+def test_query_result_skips_empty_pages():
+    """An empty page with a last key (all items filtered out) doesn't stop iteration."""
+    from pydynox.query import QueryResult
+
+    core = MagicMock()
+    core.query_page.side_effect = [
+        _page([], {"pk": "A", "sk": "1"}),
+        _page([{"pk": "A", "sk": "2"}], None),
+    ]
+
+    result = QueryResult(core, "users", "#pk = :pk", filter_expression="#s = :s")
+
+    assert [item["sk"] for item in result] == ["2"]
+
+
+def test_query_result_next_and_for_share_position():
+    """next(result) and a for loop continue from the same item."""
+    from pydynox.query import QueryResult
+
+    core = MagicMock()
+    core.query_page.side_effect = [
+        _page([{"sk": "1"}, {"sk": "2"}], {"sk": "2"}),
+        _page([{"sk": "3"}], None),
+    ]
+
+    result = QueryResult(core, "users", "#pk = :pk")
+
+    assert next(result)["sk"] == "1"
+    assert [item["sk"] for item in result] == ["2", "3"]
+    with pytest.raises(StopIteration):
+        next(result)
+
+
+@pytest.mark.parametrize(
+    "limit, consistent_read, expected",
+    [
+        (None, False, 0.5),
+        (None, True, 1.0),
+        (10, False, 5.0),
+        (10, True, 10.0),
+    ],
+)
+def test_query_result_rcu_estimate(limit, consistent_read, expected):
+    """Eventually consistent reads are estimated at half the RCU of consistent reads."""
+    from pydynox.query import QueryResult
+
+    core = MagicMock()
+    core.query_page.return_value = _page([], None, consumed_rcu=0.0)
+    acquire_rcu = MagicMock()
+
+    result = QueryResult(
+        core,
+        "users",
+        "#pk = :pk",
+        limit=limit,
+        consistent_read=consistent_read,
+        acquire_rcu=acquire_rcu,
+    )
+    list(result)
+
+    acquire_rcu.assert_called_once_with(expected)
+
+
+def test_query_result_acquires_rcu_used_beyond_estimate():
+    """When a page uses more RCU than estimated, the difference is acquired after."""
+    from pydynox.query import QueryResult
+
+    core = MagicMock()
+    core.query_page.return_value = _page([{"sk": "1"}], None, consumed_rcu=8.0)
+    acquire_rcu = MagicMock()
+
+    list(QueryResult(core, "users", "#pk = :pk", limit=10, acquire_rcu=acquire_rcu))
+
+    # 5 RCU estimated before the request, 3 more after
+    assert [call.args[0] for call in acquire_rcu.call_args_list] == [5.0, 3.0]
+
+
+async def test_async_query_result_acquires_rcu_off_the_event_loop():
+    """The limiter may sleep, so AsyncQueryResult calls it from a worker thread."""
+    import threading
+
+    from pydynox.query import AsyncQueryResult
+
+    page = _page([{"pk": "a"}], None, consumed_rcu=8.0)
+    core = MagicMock()
+
+    async def async_query_page(*args, **kwargs):
+        return {"items": page[0], "last_evaluated_key": page[1], "metrics": page[2]}
+
+    core.async_query_page = async_query_page
+    threads = []
+    acquire_rcu = MagicMock(side_effect=lambda rcu: threads.append(threading.current_thread()))
+
+    result = AsyncQueryResult(core, "users", "#pk = :pk", limit=10, acquire_rcu=acquire_rcu)
+
+    assert [item async for item in result] == [{"pk": "a"}]
+    assert [call.args[0] for call in acquire_rcu.call_args_list] == [5.0, 3.0]
+    assert threading.current_thread() not in threads
+
+
+def test_query_result_count_and_scanned_count():
+    """count and scanned_count add up the counts DynamoDB sends with each page."""
+    from pydynox.query import QueryResult
+
+    core = MagicMock()
+    core.query_page.side_effect = [
+        _page([{"sk": "1"}, {"sk": "2"}], {"sk": "2"}, scanned_count=5),
+        _page([{"sk": "3"}], None, scanned_count=4),
+    ]
+
+    result = QueryResult(core, "users", "#pk = :pk", filter_expression="#s = :s")
+    assert result.count == 0
+
+    for _ in result:
+        pass
+
+    assert result.count == 3
+    assert result.scanned_count == 9
+
+
+def test_query_result_pages():
+    """pages() yields one list per request."""
+    from pydynox.query import QueryResult
+
+    core = MagicMock()
+    core.query_page.side_effect = [
+        _page([{"sk": "1"}, {"sk": "2"}], {"sk": "2"}),
+        _page([], {"sk": "3"}),
+        _page([{"sk": "4"}], None),
+    ]
+
+    result = QueryResult(core, "users", "#pk = :pk")
+    pages = [[item["sk"] for item in page] for page in result.pages()]
+
+    assert pages == [["1", "2"], [], ["4"]]
+    assert result.count == 3
+    assert list(result) == []
+
+
+def test_query_result_frees_finished_page_before_next_request():
+    """The previous page is not kept alive while the next page is fetched."""
+    import weakref
+
+    from pydynox.query import QueryResult
+
+    class Marker:
+        pass
+
+    refs = []
+    alive_during_second_request = []
+
+    def query_page(*args, **kwargs):
+        if not refs:
+            marker = Marker()
+            refs.append(weakref.ref(marker))
+            return _page([{"marker": marker}, {"sk": "2"}], {"sk": "2"})
+        alive_during_second_request.append(refs[0]() is not None)
+        return _page([], None)
+
+    core = MagicMock()
+    core.query_page.side_effect = query_page
+
+    for _ in QueryResult(core, "users", "#pk = :pk"):
+        pass
+
+    assert alive_during_second_request == [False]
@@ -158,3 +158,50 @@ def test_adaptive_rate_configurations(max_rcu, max_wcu, min_rcu):
     assert limiter.max_wcu == max_wcu
     # Should start at 50% of max
     assert limiter.current_rcu == max_rcu * 0.5
+
+
+_ACQUIRE_MORE_THAN_BURST_SCRIPT = """
+from pydynox.rate_limit import FixedRate
+
+limiter = FixedRate(rcu=200, burst=5)
+limiter._acquire_rcu(20.0)
+assert limiter.consumed_rcu == 20.0
+"""
+
+
+def test_acquire_more_than_burst_does_not_block_forever(run_script):
+    """An amount bigger than the burst is taken in parts as the bucket refills."""
+    run_script(
+        _ACQUIRE_MORE_THAN_BURST_SCRIPT,
+        timeout=30,
+        message="acquire larger than the burst never returned",
+    )
+
+
+_ACQUIRE_RELEASES_GIL_SCRIPT = """
+import threading
+import time
+
+from pydynox.rate_limit import FixedRate
+
+limiter = FixedRate(rcu=1, burst=1)
+limiter._acquire_rcu(1.0)
+
+# The bucket is empty, so this waits about a second for the refill
+waiter = threading.Thread(target=limiter._acquire_rcu, args=(1.0,))
+start = time.monotonic()
+waiter.start()
+time.sleep(0.05)
+elapsed = time.monotonic() - start
+waiter.join()
+assert elapsed < 0.5, f"main thread was blocked for {elapsed:.2f}s"
+"""
+
+
+def test_acquire_releases_gil_while_waiting(run_script):
+    """Other threads keep running while the limiter waits for tokens."""
+    run_script(
+        _ACQUIRE_RELEASES_GIL_SCRIPT,
+        timeout=30,
+        message="rate limiter wait blocked other threads",
+    )